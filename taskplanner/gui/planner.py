@@ -2,9 +2,8 @@
 This module defines a planner widget and related widgets.
 """
 import screeninfo
-from PyQt5.QtCore import Qt, QPoint, QDate, QEvent
+from PyQt5.QtCore import Qt, QPoint, QDate, QEvent, QTimer, pyqtSlot
 from PyQt5.Qt import QGraphicsDropShadowEffect, QColor
-from PyQt5.QtGui import QIcon
 from PyQt5.QtWidgets import \
     (
     QHBoxLayout,
@@ -22,19 +21,27 @@ from PyQt5.QtWidgets import \
     QGridLayout,
     QSlider,
     QFontComboBox,
+    QSizePolicy,
+    QSpacerItem,
+    QWIDGETSIZE_MAX,
     )
 
 from signalslot import Signal
 import os
 from logging import warning
+from weakref import WeakValueDictionary
+from functools import lru_cache
 from numpy import floor, ceil
-from datetime import date
+import calendar
+from bisect import bisect_right
+from datetime import date, timedelta
 from dateutil.relativedelta import relativedelta
-from taskplanner.tasks import Task
+from taskplanner.tasks import Task, PRIORITY_LEVELS, PROGRESS_LEVELS
 from taskplanner.planner import Planner
-from taskplanner.gui.tasks import TaskWidget, TaskWidgetSimple, task_widget_widget_open
+from taskplanner.gui.tasks import TaskWidget, TaskWidgetSimple, task_widget_widget_open, task_widget_flush_edits, \
+    diff_task_widgets
 from taskplanner.gui.styles import TaskWidgetStyle, PlannerWidgetStyle, ICON_SIZES, COLOR_PALETTES, FONTS
-from taskplanner.gui.utilities import set_style, get_primary_screen, select_file, select_directory
+from taskplanner.gui.utilities import set_style, set_style_sheet, get_primary_screen, get_icon, select_file, select_directory
 
 SCREEN = get_primary_screen()
 SCREEN_WIDTH = SCREEN.width
@@ -52,6 +59,183 @@ BUCKET_PROPERTY_NAMES.sort()
 TIMELINE_VIEW_TYPES = ['daily',
                        'weekly',
                        'monthly']
+# Maximum number of task widgets built per pass of the task list
+TASK_WIDGET_BATCH_SIZE = 20
+# Number of month widgets whose week widgets are built eagerly. The week widgets
+# of the other months are built when the month widget is first painted.
+EAGER_MONTH_WIDGETS = 2
+# Formats of the calendar labels
+MONTH_LABEL_FORMAT = '%B %Y'
+WEEK_LABEL_FORMAT = 'Week %W'
+# Day labels show the first three letters of the weekday name, in the current locale
+DAY_LABEL_FORMAT = '%A'
+# Object name of the day widgets, which are styled by their week widget
+DAY_WIDGET_OBJECT_NAME = 'day_widget'
+
+
+def _week_days(week_date: date):
+    """
+    Computes the days of a week, from its first day.
+
+    :param week_date: :py:class:'datetime.date'
+        The first day of the week
+    :return: tuple of :py:class:'datetime.date'
+        The days until the end of the week (Sunday) or the end of the month, whichever comes first.
+    """
+    n_days_in_month = calendar.monthrange(week_date.year, week_date.month)[1]
+    days_this_week = min(7 - week_date.weekday(), n_days_in_month - week_date.day + 1)
+    return tuple(week_date + timedelta(days=i) for i in range(days_this_week))
+
+
+@lru_cache(maxsize=64)
+def _month_weeks(year: int,
+                 month: int):
+    """
+    Computes the weeks of a month. The result is cached, because the same months are displayed
+    every time the calendar widget is rebuilt.
+
+    :param year: int
+    :param month: int
+    :return: tuple of (week_date, (day_dates))
+        A week starts on a Monday or on the first day of the month,
+        and ends on a Sunday or on the last day of the month.
+    """
+    weeks = []
+    week_date = date(year, month, 1)
+    while week_date.month == month:
+        day_dates = _week_days(week_date)
+        weeks.append((week_date, day_dates))
+        week_date = day_dates[-1] + timedelta(days=1)
+    return tuple(weeks)
+
+
+def _build_month_model(start_date: date,
+                       n_months: int):
+    """
+    Computes the dates displayed by the calendar widget, before any widget is made.
+
+    :param start_date: :py:class:'datetime.date'
+        Any day of the first displayed month
+    :param n_months: int
+        The number of displayed months
+    :return: list of (month_date, ((week_date, (day_dates)), ...))
+    """
+    model = []
+    month_index = start_date.month - 1
+    for count in range(n_months):
+        # First day of the month, wrapping around the end of the year
+        month_date = date(start_date.year + (month_index + count) // 12,
+                          (month_index + count) % 12 + 1,
+                          1)
+        model.append((month_date, _month_weeks(month_date.year, month_date.month)))
+    return model
+
+
+@lru_cache(maxsize=512)
+def _format_date(ordinal: int,
+                 date_format: str):
+    """
+    Formats a date for the calendar labels. The result is cached, because the same dates
+    are labelled every time the calendar widget is rebuilt.
+
+    :param ordinal: int
+        The proleptic Gregorian ordinal of the date, as returned by :py:meth:'datetime.date.toordinal'
+    :param date_format: str
+        The format string passed to :py:meth:'datetime.date.strftime'
+    :return: str
+    """
+    return date.fromordinal(ordinal).strftime(date_format)
+
+
+@lru_cache(maxsize=8)
+def _day_widgets_stylesheet(day_stylesheet: str):
+    """
+    Scopes the style sheet of a day widget to the object name of the day widgets, so that it can be set
+    once on their week widget, instead of being parsed for each day widget.
+
+    :param day_stylesheet: str
+        The style sheet of a day widget
+    :return: str
+    """
+    return day_stylesheet.replace('QLabel', f'QLabel#{DAY_WIDGET_OBJECT_NAME}')
+
+
+@lru_cache(maxsize=64)
+def _timeline_label_stylesheet(color: str,
+                               font_size: str):
+    """
+    Builds the style sheet of a timeline label. The result is cached, because tasks share few distinct colors.
+
+    :param color: str
+        The color of the task
+    :param font_size: str
+        The font size of the label
+    :return: str
+    """
+    return '''
+    QPushButton
+    {
+        background-color:%s;
+        border:0px solid %s;
+        font-size:%s;
+        text-align:left;
+        padding-left:10px;
+    }
+    QPushButton:hover
+    {
+        text-decoration:underline;
+    }
+    ''' % (color,
+           color,
+           font_size)
+
+
+@lru_cache(maxsize=8)
+def _priority_combobox_geometry(style_name: str,
+                                font: tuple):
+    """
+    Measures the geometry of the priority combobox of a task widget. An example task widget
+    has to be built for this, so the result is cached and the example widget is discarded right away.
+
+    :param style_name: str
+        The name of the task widget style
+    :param font: tuple
+        The items of the style's font, as returned by :py:meth:'dict.items'
+    :return: :py:class:'QRect'
+    """
+    task_widget_example = TaskWidget(task=Task(),
+                                     style=TaskWidgetStyle(font=dict(font),
+                                                           style_name=style_name))
+    geometry = task_widget_example.priority_widget.combobox.geometry()
+    # The example widget must not be hidden when a task widget is opened, nor flushed on close, once it is deleted
+    task_widget_widget_open.disconnect(task_widget_example.hide)
+    task_widget_flush_edits.disconnect(task_widget_example.flush_edits)
+    task_widget_example.setParent(None)
+    task_widget_example.deleteLater()
+    return geometry
+
+
+@lru_cache(maxsize=8)
+def _cached_task_widget_style(style_name: str,
+                              color_palette: tuple,
+                              font: tuple):
+    return TaskWidgetStyle(color_palette=dict(color_palette),
+                           font=dict(font),
+                           style_name=style_name)
+
+
+def _task_widget_style(style: PlannerWidgetStyle):
+    """
+    Returns the task widget style matching a planner widget style. Styles are cached by content, so that
+    all the task widgets of the planner share the same instance, however many task lists build them.
+
+    :param style: :py:class:'taskplanner.gui.styles.PlannerWidgetStyle'
+        The planner widget style
+    :return: :py:class:'taskplanner.gui.styles.TaskWidgetStyle'
+    """
+    return _cached_task_widget_style(style.style_name,
+                                     tuple(sorted(style.color_palette.items())),
+                                     tuple(sorted(style.font.items())))
 
 
 class PlannerWidget(QTabWidget):
@@ -83,13 +267,21 @@ class PlannerWidget(QTabWidget):
                           height)
         # Planner tab
         self.make_planner_tab()
-        # Task buckets tab
-        self.make_task_buckets_tab()
-        # Settings tab
-        self.make_settings_tab()
-        # Set style
-        self.settings_tab.graphics_settings_widget.apply_pushbutton.click()
-        self.planner.tasks_changed.connect(lambda **kwargs: self.to_file())
+        # Task buckets tab, built the first time it is selected
+        self.task_buckets_tab = None
+        self.addTab(QWidget(), 'Task Buckets')
+        # Settings tab, built the first time it is selected
+        self.settings_tab = None
+        self.addTab(QWidget(), 'Settings')
+        # Set style, reusing the style the tabs were built with
+        self.set_style()
+        self.currentChanged.connect(self.make_selected_tab)
+        # Save the planner once per burst of task changes
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(0)
+        self._save_timer.timeout.connect(self.to_file)
+        self.planner.tasks_changed.connect(self._schedule_save)
 
     def set_style(self, style: PlannerWidgetStyle = None):
         self._style = style if style is not None else self._style
@@ -97,454 +289,48 @@ class PlannerWidget(QTabWidget):
             set_style(widget=self,
                       stylesheets=self._style.stylesheets['main'])
             self.planner_tab.set_style(self._style)
-            self.task_buckets_tab.set_style(self._style)
-            self.settings_tab.set_style(self._style)
+            if self.task_buckets_tab is not None:
+                self.task_buckets_tab.set_style(self._style)
+            if self.settings_tab is not None:
+                self.settings_tab.set_style(self._style)
         self.tabBar().setFixedHeight(int(self.height() * 0.03))
 
+    def _schedule_save(self, **kwargs):
+        # The planner is saved once the current burst of changes is over
+        self._save_timer.start()
+
     def closeEvent(self, a0):
+        # Set the text typed in task widgets since the last pause to the tasks, before they are saved
+        task_widget_flush_edits.emit()
         self.to_file()
         a0.accept()
 
-    def make_planner_tab(self):
-        class PlannerTab(QWidget):
-            """
-            This widget contains:
-                - On the left, a widget containing vertical list of :py:class:'taskplanner.gui.TaskWidgetSimple' of top-level tasks
-                - On the right, a widget containing timelines corresponding to each task and its related subtasks
-            """
-            def __init__(self,
-                         planner: Planner,
-                         parent: QWidget = None,
-                         style: PlannerWidgetStyle = DEFAULT_PLANNER_STYLE
-                         ):
-                """
-                :param planner: :py:class:'taskplanner.planner.Planner'
-                    The planner associated to this widget
-                :param parent: :py:class:'QWidget', optional
-                    The parent widget
-                """
-                self.planner, self._style = planner, style
-                super().__init__(parent=parent)
-                # Layout
-                self.layout = QVBoxLayout(self)
-                self.layout.setAlignment(Qt.AlignTop)
-                # Geometry
-                self.setGeometry(self.parent().geometry())
-                # Horizontal layout for (new task textedit, planner settings)
-                self.new_task_settings_layout = QHBoxLayout()
-                self.new_task_settings_layout.setAlignment(Qt.AlignLeft)
-                self.layout.addLayout(self.new_task_settings_layout)
-                # New task textedit
-                self.make_new_task_textedit()
-                self.new_task_textedit.setFixedSize(int(self.width() * 0.15),
-                                                    int(self.height() * 0.035))
-                # Upload task pushbutton
-                self.make_upload_task_pushbutton()
-                self.upload_task_pushbutton.setFixedSize(int(self.upload_task_pushbutton.iconSize().width()*2),
-                                                         int(self.upload_task_pushbutton.iconSize().height()*2))
-                self.new_task_settings_layout.addSpacing(int(SCREEN_WIDTH * 0.35)
-                                                         - self.new_task_textedit.width()
-                                                         - self.upload_task_pushbutton.width())
-                # Vertical layout for task list widget
-                self.task_list_layout = QVBoxLayout()
-                self.task_list_layout.setAlignment(Qt.AlignTop)
-                # Horizontal layout for calendar widget
-                self.calendar_layout = QHBoxLayout()
-                self.calendar_layout.setAlignment(Qt.AlignLeft)
-                self.layout.addLayout(self.calendar_layout)
-                self.calendar_layout.addLayout(self.task_list_layout)
-                # Horizontal layout for task list and timelines
-                self.task_timelines_layout = QHBoxLayout()
-                self.task_timelines_layout.setAlignment(Qt.AlignLeft)
-                self.layout.addLayout(self.task_timelines_layout)
-                # Task list widget
-                self.make_task_list_widget()
-                ## Scroll area
-                self.task_list_scrollarea = QScrollArea()
-                self.task_list_scrollarea.setWidgetResizable(True)
-                self.task_list_scrollarea.setWidget(self.task_list_widget)
-                self.task_list_layout.addWidget(self.task_list_scrollarea)
-                self.task_list_scrollarea.setFixedWidth(int(SCREEN_WIDTH * 0.35))
-                # Calendar widget
-                self.make_calendar_widget()
-                ## Scroll area
-                self.calendar_scrollarea = QScrollArea()
-                self.calendar_scrollarea.setWidgetResizable(True)
-                self.calendar_scrollarea.setWidget(self.calendar_widget)
-                self.calendar_layout.addWidget(self.calendar_scrollarea)
-                self.task_timelines_layout.addLayout(self.calendar_widget.timelines_layout)
-                # Adjust task list widget vertical position
-                self.task_list_layout.insertSpacing(0,
-                                                    self.calendar_widget.month_widgets[0].height())
-                # View selector
-                self.make_view_selector()
-                task_widget_example = TaskWidget(task=Task(),
-                                                 style=TaskWidgetStyle(color_palette=self._style.color_palette,
-                                                                       font=self._style.font,
-                                                                       style_name=self._style.style_name))
-                self.view_selector.combobox.setGeometry(task_widget_example.priority_widget.combobox.geometry())
-                self.view_selector.setFixedSize(int(SCREEN_WIDTH * 0.08),
-                                                int(self.height() * 0.08))
-                # Calendar start and end dates
-                self.make_start_end_dates()
-                self.start_date_widget.setFixedSize(int(SCREEN_WIDTH * 0.05),
-                                                    int(self.height() * 0.05))
-                self.end_date_widget.setFixedSize(int(SCREEN_WIDTH * 0.05),
-                                                  int(self.height() * 0.05))
-
-                self.set_style()
-                # Lock the vertical scrollbars of the timelines and the task list
-                self.calendar_scrollarea.setVerticalScrollBar(self.task_list_scrollarea.verticalScrollBar())
-
-                self.task_timelines_layout.setSpacing(0)
-
-            def set_style(self, style: PlannerWidgetStyle = None):
-                self._style = style if style is not None else self._style
-                if self._style is not None:
-                    set_style(widget=self,
-                              stylesheets=self._style.stylesheets
-                              ['planner_tab']['main'])
-                    set_style(widget=self.task_list_scrollarea,
-                              stylesheets=self._style.stylesheets
-                              ['planner_tab']['task_list_scrollarea'])
-                    set_style(widget=self.task_list_widget,
-                              stylesheets=self._style.stylesheets
-                              ['planner_tab']['task_list_widget'])
-                    set_style(widget=self.calendar_scrollarea,
-                              stylesheets=self._style.stylesheets
-                              ['planner_tab']['calendar_scrollarea'])
-                    set_style(widget=self.new_task_textedit,
-                              stylesheets=self._style.stylesheets
-                              ['planner_tab']['new_task_textedit'])
-                    set_style(widget=self.upload_task_pushbutton,
-                              stylesheets=self._style.stylesheets
-                              ['planner_tab']
-                              ['upload_task_pushbutton'])
-                    self.task_list_widget.set_style(self._style)
-                    self.calendar_widget.set_style(self._style)
-                    self.view_selector.set_style(self._style)
-                    self.start_date_widget.set_style(self._style)
-                    self.end_date_widget.set_style(self._style)
-
-
-            def make_new_task_textedit(self):
-                # textedit to define a new assignee when the 'plus' button is clicked
-                self.new_task_textedit = QTextEdit()
-                # Layout
-                self.new_task_settings_layout.addWidget(self.new_task_textedit)
-
-                def callback():
-                    if '\n' in self.new_task_textedit.toPlainText():
-                        new_task = Task(name=self.new_task_textedit.toPlainText()[:-1])
-                        self.new_task_textedit.blockSignals(True)
-                        self.new_task_textedit.setText('')
-                        self.new_task_textedit.blockSignals(False)
-                        """
-                        For some reason, the cursor is normally reset to the start of the 
-                        widget. One then needs to move the cursor to the end and then reset the cursor
-                        """
-                        # Move cursor to the end
-                        cursor = self.new_task_textedit.textCursor()
-                        cursor.movePosition(cursor.Left,
-                                            cursor.MoveAnchor,
-                                            0)
-                        """
-                        For some other reason, all text is also automatically selected, so one needs to
-                        clear the selection.
-                        """
-                        cursor.clearSelection()
-                        # Add new subtask
-                        self.planner.add_tasks(new_task)
-
-                self.new_task_textedit.textChanged.connect(lambda: callback())
-                self.new_task_textedit.setPlaceholderText("+ New Task")
-
-            def make_upload_task_pushbutton(self):
-                self.upload_task_pushbutton = QPushButton()
-                self.new_task_settings_layout.addWidget(self.upload_task_pushbutton)
-                # Icon
-                icon_path = self._style.icon_path
-                icon_filename = os.path.join(icon_path, 'upload.png')
-                self.upload_task_pushbutton.setIcon(QIcon(icon_filename))
-
-                # User interactions
-                def callback():
-                    # Show the new textedit
-                    filename = select_file(title=f'Select the File Containing the Task to Be Uploaded')
-                    try:
-                        self.planner.add_tasks(Task.from_file(filename=filename))
-                    except Exception as e:
-                        print(e)
-
-                self.upload_task_pushbutton.clicked.connect(lambda: callback())
-
-
-            def make_view_selector(self):
-                class ViewSelector(QFrame):
-                    """
-                    This widget contains:
-                        - A label indicating that this is a view selector
-                        - A combobox containing the view types
-                    """
-
-                    def __init__(self,
-                                 calendar_widget: CalendarWidget,
-                                 parent: QWidget = None,
-                                 style: PlannerWidgetStyle = None):
-                        self._style = style
-                        self.calendar_widget = calendar_widget
-                        super().__init__(parent=parent)
-                        # Layout
-                        self.layout = QVBoxLayout(self)
-                        # Label
-                        self.make_label()
-                        # Combobox
-                        self.make_combobox()
-                        # Style
-                        self.set_style()
-                        self.layout.addStretch()
-
-                    def set_style(self, style: PlannerWidgetStyle = None):
-                        self._style = style if style is not None else self._style
-                        if self._style is not None:
-                            set_style(widget=self,
-                                      stylesheets=self._style.stylesheets
-                                      ['planner_tab']
-                                      ['view_selector'])
-
-                    def make_label(self):
-                        self.label = QLabel('Planner View')
-                        self.layout.addWidget(self.label)
-                        self.label.setAlignment(Qt.AlignLeft)
-
-                    def make_combobox(self):
-                        self.combobox = QComboBox()
-                        # Layout
-                        self.layout.addWidget(self.combobox)
-                        # Add items
-                        self.combobox.addItems([view.title() for view in TIMELINE_VIEW_TYPES])
-
-                        # User interactions
-                        def clicked():
-                            self.calendar_widget.view_type = self.combobox.currentText().lower()
-
-                        def update():
-                            self.combobox.blockSignals(True)
-                            self.combobox.setCurrentText(self.calendar_widget.view_type.title())
-                            self.combobox.blockSignals(False)
-
-                        # Connect task and widget
-                        self.combobox.currentIndexChanged.connect(clicked)
-                        self.calendar_widget.view_type_changed.connect(lambda **kwargs: update())
-                        # Set initial value
-                        update()
-
-                self.view_selector = ViewSelector(calendar_widget=self.calendar_widget,
-                                                  parent=self,
-                                                  style=self._style)
-                self.new_task_settings_layout.addWidget(self.view_selector)
-
-
-            def make_task_list_widget(self):
-                self.task_list_widget = TaskListWidget(planner=self.planner,
-                                                       parent=self,
-                                                       style=self._style)
-
-            def make_calendar_widget(self):
-                self.calendar_widget = CalendarWidget(planner=self.planner,
-                                                        task_list_widget=self.task_list_widget,
-                                                        parent=self,
-                                                        start_date=date.today(),
-                                                        end_date=date.today() + relativedelta(months=6),
-                                                        style=self._style)
-
-            def make_start_end_dates(self):
-                class DateWidget(QWidget):
-                    """
-                    This widget contains:
-                        - An icon symbolizing the type of time mode (start, end, ...)
-                        - A label indicating the selected date
-                        - A calendar widget that allows the user to select a day
-                    """
-
-                    def __init__(self,
-                                 planner: Planner,
-                                 calendar_timelines_widget: CalendarWidget,
-                                 parent: QWidget = None,
-                                 time_mode: str = 'start',
-                                 style: PlannerWidgetStyle = None):
-                        """
-                        :param task: :py:class:'taskplanner.tasks.Task'
-                            The task associated to this widget
-                        :param parent: :py:class:'QWidget', optional
-                            The parent widget
-                        :param time_mode: str, optional
-                            The time mode, e.g., 'start', 'end'.
-                        """
-                        TIME_MODES = ['start', 'end']
-                        if time_mode not in TIME_MODES:
-                            raise ValueError(
-                                f'Unrecognized time more {time_mode}. Possible time modes are {tuple(TIME_MODES)}')
-                        self.planner = planner
-                        self.calendar_timelines_widget = calendar_timelines_widget
-                        self.time_mode = time_mode
-                        self._style = style
-                        super().__init__(parent=parent)
-                        # Layout
-                        self.layout = QVBoxLayout()
-                        self.setLayout(self.layout)
-                        self.layout.setContentsMargins(0, 0, 0, 0)
-                        # Label
-                        self.make_label()
-                        # Label
-                        self.make_pushbutton()
-                        # Calendar widget
-                        self.make_calendar_widget()
-                        self.set_style()
-
-                    def set_style(self, style: PlannerWidgetStyle = None):
-                        self._style = style if style is not None else self._style
-                        if self._style is not None:
-                            set_style(widget=self,
-                                      stylesheets=self._style.stylesheets
-                                      ['planner_tab']
-                                      [f'{self.time_mode}_date_widget'])
-
-                    def make_label(self):
-                        self.label = QLabel(f'{self.time_mode.title()} Date')
-                        self.layout.addWidget(self.label)
-                        self.label.setAlignment(Qt.AlignCenter)
-
-                    def make_pushbutton(self):
-                        self.pushbutton = QPushButton()
-                        # Layout
-                        self.layout.addWidget(self.pushbutton)
-                        # Connect tasks and date widget
-                        for task in self.planner.tasks:
-                            all_descendants = [task] + list(task.descendants)
-                            for t in all_descendants:
-                                getattr(t, f'{self.time_mode}_date_changed').connect
-                                (lambda **kwargs: self.update_label())
-                        self.update_label()
-
-                        def clicked():
-                            self.calendar_widget.show()
-                            self.calendar_widget.blockSignals(True)
-                            current_date = getattr(self.calendar_timelines_widget, f'{self.time_mode}_date')
-                            self.calendar_widget.setSelectedDate(QDate(current_date.year,
-                                                                       current_date.month,
-                                                                       current_date.day))
-                            self.calendar_widget.blockSignals(False)
-
-                        self.pushbutton.clicked.connect(clicked)
-
-                    def make_calendar_widget(self):
-                        self.calendar_widget = QCalendarWidget()
-                        self.calendar_widget.setGridVisible(True)
-                        # Geometry
-                        x, y, w, h = [getattr(self.parent().geometry(), f'{z}')() for z in ['x',
-                                                                                            'y',
-                                                                                            'width',
-                                                                                            'height']]
-                        self.calendar_widget.setWindowTitle(f'{self.time_mode.title()} Date')
-                        self.calendar_widget.setGeometry(int(x + 1.5 * w),
-                                                         int(y + h / 2),
-                                                         self.calendar_widget.width(),
-                                                         self.calendar_widget.height())
-
-                        def callback():
-                            from datetime import date as dt
-                            # Get the extreme start and end dates among all tasks of the planner
-                            first_start_date, last_end_date = [], []
-                            for task in self.planner.tasks:
-                                first_start_date += [min([t.start_date for t in [task] + list(task.descendants)])]
-                                last_end_date += [max([t.end_date for t in [task] + list(task.descendants)])]
-                            if first_start_date:
-                                first_start_date = min(first_start_date)
-                            else:
-                                first_start_date = dt.today()
-                            if last_end_date:
-                                last_end_date = max(last_end_date)
-                            else:
-                                last_end_date = first_start_date + relativedelta(months=6)
-                            # Get date from calendar
-                            date = self.calendar_widget.selectedDate()
-                            date = dt(year=date.year(), month=date.month(), day=1)
-                            if self.time_mode == 'start':
-                                if date > self.calendar_timelines_widget.end_date:
-                                    warning(f'CalendarWidget: start date {date.strftime("%d/%m/%y")} '
-                                            f'is greater than end date '
-                                            f'{self.calendar_timelines_widget.end_date.strftime("%d/%m/%y")}')
-                                    date = dt.today()
-                                    date = dt(date.year, date.month, 1)
-                                    self.calendar_timelines_widget.end_date = date + relativedelta(months=6)
-                            else:
-                                if date < self.calendar_timelines_widget.start_date:
-                                    warning(f'CalendarWidget: end date {date.strftime("%d/%m/%y")} '
-                                            f'is smaller than end date '
-                                            f'{self.calendar_timelines_widget.start_date.strftime("%d/%m/%y")}')
-                                    date = self.calendar_timelines_widget.start_date + relativedelta(months=6)
-                                    date = dt(date.year, date.month, 1)
-
-                            if self.time_mode == 'start' and date <= first_start_date\
-                                or self.time_mode == 'end' and date >= last_end_date:
-                                # Set date to calendar
-                                setattr(self.calendar_timelines_widget, f'{self.time_mode}_date', date)
-
-                            self.update_label()
-                            # Hide calendar
-                            self.calendar_widget.hide()
-
-                        self.calendar_widget.clicked.connect(callback)
-
-                    # User interactions
-                    def update_label(self):
-                        # Get the extreme start and end dates among all tasks of the planner
-                        from datetime import date as dt
-                        first_start_date, last_end_date = [], []
-                        for task in self.planner.tasks:
-                            first_start_date += [min([t.start_date for t in [task] + list(task.descendants)])]
-                            last_end_date += [max([t.end_date for t in [task] + list(task.descendants)])]
-                        if first_start_date:
-                            first_start_date = min(first_start_date)
-                        else:
-                            first_start_date = dt.today()
-                        if last_end_date:
-                            last_end_date = max(last_end_date)
-                        else:
-                            last_end_date = first_start_date + relativedelta(months=6)
-
-                        date = first_start_date if self.time_mode == 'start' else last_end_date
-                        date = dt(date.year, date.month, 1)
-                        if date < self.calendar_timelines_widget.start_date \
-                            or date > self.calendar_timelines_widget.end_date:
-                            setattr(self.calendar_timelines_widget, f'{self.time_mode}_date', date)
-                        else:
-                            date = getattr(self.calendar_timelines_widget, f'{self.time_mode}_date')
-                            date = dt(date.year, date.month, 1)
-                        # Handle the definition of end date in the calendar widget, which includes the whole month
-                        if self.time_mode == 'end':
-                            date += relativedelta(months=1)
-                        self.pushbutton.setText(f'{date.day}/{date.month}/{date.year}')
-
-                self.new_task_settings_layout.addSpacing(int(self.width() * 0.1))
-                self.start_date_widget = DateWidget(planner=self.planner,
-                                                    calendar_timelines_widget=self.calendar_widget,
-                                                    parent=self,
-                                                    time_mode='start',
-                                                    style=self._style)
-                self.new_task_settings_layout.addWidget(self.start_date_widget)
-
-                self.new_task_settings_layout.addSpacing(int(self.width() * 0.1))
-
-                self.end_date_widget = DateWidget(planner=self.planner,
-                                                    calendar_timelines_widget=self.calendar_widget,
-                                                    parent=self,
-                                                    time_mode='end',
-                                                    style=self._style)
-                self.new_task_settings_layout.addWidget(self.end_date_widget)
+    @pyqtSlot(int)
+    def make_selected_tab(self, index: int):
+        # Build the tabs that are only made when first selected
+        if self.tabText(index) == 'Task Buckets' and self.task_buckets_tab is None:
+            self.make_task_buckets_tab()
+        elif self.tabText(index) == 'Settings' and self.settings_tab is None:
+            self.make_settings_tab()
 
+    def replace_tab(self, widget: QWidget, label: str):
+        """
+        Replaces the placeholder of a tab that is built when first selected.
+        :param widget: :py:class:'QWidget'
+            The tab widget
+        :param label: str
+            The label of the tab
+        """
+        index = [self.tabText(i) for i in range(self.count())].index(label)
+        placeholder = self.widget(index)
+        self.blockSignals(True)
+        self.removeTab(index)
+        self.insertTab(index, widget, label)
+        self.setCurrentIndex(index)
+        self.blockSignals(False)
+        placeholder.deleteLater()
 
+    def make_planner_tab(self):
         self.planner_tab = PlannerTab(planner=self.planner,
                                       parent=self,
                                       style=self._style)
@@ -667,8 +453,7 @@ class PlannerWidget(QTabWidget):
                     def make_label(self):
                         self.label = QLabel('Sort By')
                         self.layout.addWidget(self.label)
-                        self.label.setAlignment(Qt.AlignLeft)
-                        self.label.setAlignment(Qt.AlignBottom)
+                        self.label.setAlignment(Qt.AlignLeft | Qt.AlignBottom)
                         self.label.setContentsMargins(0, 0, 0, 0)
 
                     def make_combobox(self):
@@ -844,8 +629,9 @@ class PlannerWidget(QTabWidget):
                             f'Time Planned for Each '
                             f'{self.bucket_list_widget.property_name.title()}')
                         self.graph_time_for_tasks.figure.axes[0].cla()
+                        # Walk the task trees once for the whole update
+                        all_tasks = self.planner.all_tasks
                         if any([widget.task_list_widget.tasks for widget in self.bucket_list_widget.bucket_widgets]):
-                            all_tasks = self.planner.all_tasks
                             n_days = []
                             for widget in self.bucket_list_widget.bucket_widgets:
                                 n_days += [sum([abs(relativedelta(t.end_date, t.start_date).days + 1)
@@ -858,7 +644,7 @@ class PlannerWidget(QTabWidget):
                                       in self.bucket_list_widget.bucket_widgets]
                             if self.bucket_list_widget.property_name == 'due date':
                                 n_days_tot = sum([abs(relativedelta(t.end_date, t.start_date).days + 1)
-                                                for t in self.planner.all_tasks])
+                                                for t in all_tasks])
                                 n_days += [n_days_tot - sum(n_days)]
                                 labels += ['Other Tasks']
                             patches, outer_labels, inner_labels = self.graph_time_for_tasks.figure.axes[0].pie(
@@ -889,7 +675,7 @@ class PlannerWidget(QTabWidget):
                             widget.task_list_widget.tasks_updated.disconnect(self.update_graph_time_for_tasks)
                             widget.task_list_widget.tasks_updated.connect(self.update_graph_time_for_tasks)
                         # Connect task start and end dates to graph updates
-                        for task in self.planner.all_tasks:
+                        for task in all_tasks:
                             task.start_date_changed.disconnect(self.update_graph_time_for_tasks)
                             task.start_date_changed.connect(self.update_graph_time_for_tasks)
 
@@ -909,7 +695,7 @@ class PlannerWidget(QTabWidget):
         self.task_buckets_tab = TaskBucketsTab(planner=self.planner,
                                                parent=self,
                                                style=self._style)
-        self.addTab(self.task_buckets_tab, 'Task Buckets')
+        self.replace_tab(self.task_buckets_tab, 'Task Buckets')
 
     def make_settings_tab(self):
         class SettingsTab(QFrame):
@@ -993,8 +779,7 @@ class PlannerWidget(QTabWidget):
                         super().__init__(parent=parent)
                         # Layout
                         self.layout = QVBoxLayout(self)
-                        self.layout.setAlignment(Qt.AlignTop)
-                        self.layout.setAlignment(Qt.AlignLeft)
+                        self.layout.setAlignment(Qt.AlignTop | Qt.AlignLeft)
                         # Title
                         self.make_title_label()
                         # Color selection widget
@@ -1196,8 +981,7 @@ class PlannerWidget(QTabWidget):
                                 super().__init__(parent=parent)
                                 # Layout
                                 self.layout = QVBoxLayout(self)
-                                self.layout.setAlignment(Qt.AlignTop)
-                                self.layout.setAlignment(Qt.AlignLeft)
+                                self.layout.setAlignment(Qt.AlignTop | Qt.AlignLeft)
                                 # Label
                                 self.make_title_label()
                                 # Layout for color selection widgets
@@ -1437,8 +1221,7 @@ class PlannerWidget(QTabWidget):
                                 super().__init__(parent=parent)
                                 # Layout
                                 self.layout = QVBoxLayout(self)
-                                self.layout.setAlignment(Qt.AlignTop)
-                                self.layout.setAlignment(Qt.AlignLeft)
+                                self.layout.setAlignment(Qt.AlignTop | Qt.AlignLeft)
                                 # Label
                                 self.make_title_label()
                                 # Layout for font selection widgets
@@ -1530,6 +1313,7 @@ class PlannerWidget(QTabWidget):
                         self.layout.addWidget(self.example_task_widget.scrollarea)
                         self.example_task_widget.title_widget.textedit.setReadOnly(True)
                         task_widget_widget_open.disconnect(self.example_task_widget.hide)
+                        task_widget_flush_edits.disconnect(self.example_task_widget.flush_edits)
 
                     def update_example_task(self):
                         self.example_task_widget.hide()
@@ -1547,7 +1331,7 @@ class PlannerWidget(QTabWidget):
                                         planner_widget=self,
                                         parent=self,
                                         style=self._style)
-        self.addTab(self.settings_tab, 'Settings')
+        self.replace_tab(self.settings_tab, 'Settings')
 
 
 
@@ -1597,7 +1381,6 @@ class PlannerWidget(QTabWidget):
         # Else, raise an error.
         if filename is None:
             if not hasattr(self, 'filename'):
-                from taskplanner.gui.utilities import select_file
                 filename = select_file(title=f'Select an empty configuration file'
                                              f'to save the task planner.')
                 self.filename = filename
@@ -1606,7 +1389,6 @@ class PlannerWidget(QTabWidget):
                 if not os.path.exists(directory):
                     warning(f'No such directory "{directory}". Asking user to select '
                                      f'an empty configuration file')
-                    from taskplanner.gui.utilities import select_file
                     filename = select_file(title=f'Select an empty configuration file '
                                                  f'to save task planner')
                     self.filename = filename
@@ -1634,7 +1416,6 @@ class PlannerWidget(QTabWidget):
         # Recognize the input file name or use the internally defined file name, if any.
         # Else, raise an error.
         if filename is None or not os.path.exists(filename):
-            from taskplanner.gui.utilities import select_file
             filename = select_file(title=f'Select a non-empty configuration file to load a task planner')
         if ".txt" not in filename:
             filename += ".txt"
@@ -1652,6 +1433,8 @@ class TaskListWidget(QWidget):
         - A textedit that allows the user to add a new top-level task to the planner
         - A vertical list of :py:class:'taskplanner.gui.TaskWidgetSimple' of top-level tasks
     """
+    # Task list widget connected to each planner's tasks_changed signal, by planner id
+    _connected_widgets = WeakValueDictionary()
 
     def __init__(self,
                  planner: Planner,
@@ -1667,54 +1450,158 @@ class TaskListWidget(QWidget):
         self.planner, self._style = planner, style
         self.task_widgets_updated = Signal()
         self._style = style
+        # Style shared by all task widgets
+        self._task_widget_style = _task_widget_style(self._style)
         super().__init__(parent=parent)
         # Layout
         self.layout = QVBoxLayout(self)
         self.layout.setAlignment(Qt.AlignTop)
         # Subtask widgets
         self.task_widgets = []
+        # Task widgets, by task id, kept in sync with the list of task widgets
+        self._task_widgets_by_task_id = {}
+        # Trailing stretch, kept for the lifetime of the widget
         self.layout.addStretch()
+        # Coalesce bursts of task changes into a single rebuild
+        self._rebuild_timer = QTimer(self)
+        self._rebuild_timer.setSingleShot(True)
+        self._rebuild_timer.setInterval(16)
+        self._rebuild_timer.timeout.connect(self.update_task_widgets)
+        # Whether a rebuild was skipped while the widget was hidden
+        self._dirty = False
+        # Top-level tasks added to and removed from the planner since the last refresh
+        self._added_tasks, self._removed_tasks = [], []
+        # Whether the next refresh must compare all tasks with the task widgets
+        self._full_refresh = False
         self.make_task_widgets()
         # Set style
         self.set_style()
         self.layout.setSpacing(15)
 
-        slots = [slot for slot in self.planner.tasks_changed._slots if
-                 'TaskListWidget.' in str(slot)]
-        for slot in slots:
-            self.planner.tasks_changed.disconnect(slot)
-        self.planner.tasks_changed.connect(lambda **kwargs: self.make_task_widgets())
+        # Replace the task list widget previously connected to this planner, if any
+        previous_widget = TaskListWidget._connected_widgets.get(id(self.planner))
+        if previous_widget is not None:
+            self.planner.tasks_changed.disconnect(previous_widget._on_tasks_changed)
+        self.planner.tasks_changed.connect(self._on_tasks_changed)
+        TaskListWidget._connected_widgets[id(self.planner)] = self
 
     def set_style(self, style: PlannerWidgetStyle = None):
         self._style = style if style is not None else self._style
         if self._style is not None:
-            for widget in self.task_widgets:
-                widget.set_style(TaskWidgetStyle(color_palette=self._style.color_palette,
-                                                 font=self._style.font,
-                                                 style_name=self._style.style_name))
+            task_widget_style = _task_widget_style(self._style)
+            # The task widgets were built with the same style
+            if task_widget_style is not self._task_widget_style:
+                self._task_widget_style = task_widget_style
+                for widget in self.task_widgets:
+                    widget.set_style(self._task_widget_style)
+
+    def _on_tasks_changed(self, added: list = None, removed: list = None, **kwargs):
+        if added is None or removed is None:
+            # The change comes without a delta (e.g., a subtask was added)
+            self._full_refresh = True
+        else:
+            self._added_tasks += added
+            self._removed_tasks += removed
+        self._rebuild_timer.start()
+
+    def showEvent(self, a0):
+        super().showEvent(a0)
+        if self._dirty:
+            self._dirty = False
+            self.make_task_widgets()
+
+    @pyqtSlot()
+    def update_task_widgets(self):
+        # Hidden widgets (e.g., in an inactive tab) are rebuilt when shown
+        if not self.isVisible():
+            self._dirty = True
+        elif self._full_refresh:
+            self.make_task_widgets()
+        else:
+            self.apply_task_changes()
+
+    def apply_task_changes(self):
+        """
+        Only updates the task widgets of the tasks that were added to or removed from the planner
+        since the last refresh.
+        """
+        added, removed = self._added_tasks, self._removed_tasks
+        self._added_tasks, self._removed_tasks = [], []
+        added_ids = {id(task) for task in added}
+        removed_ids = {id(task) for task in removed}
+        # A task may appear more than once in the changes (e.g., it was added, removed and added again)
+        # before the refresh: only then do the planner's tasks need to be looked up
+        current_ids = None
+        if len(added_ids | removed_ids) < len(added) + len(removed):
+            current_ids = {id(task) for task in self.planner.tasks}
+        # Each task gets at most one task widget, built in the order the tasks were added
+        missing = []
+        missing_ids = set()
+        for task in added:
+            task_id = id(task)
+            if task_id in missing_ids or task_id in self._task_widgets_by_task_id:
+                continue
+            if current_ids is None or task_id in current_ids:
+                missing_ids.add(task_id)
+                missing.append(task)
+        stale = [self._task_widgets_by_task_id[task_id] for task_id in removed_ids
+                 if task_id in self._task_widgets_by_task_id
+                 and (current_ids is None or task_id not in current_ids)]
+        self._update_task_widgets(missing=missing,
+                                  stale=stale)
 
     def make_task_widgets(self):
-        self.layout.removeItem(self.layout.itemAt(self.layout.count() - 1))
-        for task in self.planner.tasks:
-            if task not in [widget.task for widget in self.task_widgets]:
-                widget = TaskWidgetSimple(parent=self,
-                                          task=task,
-                                          planner=self.planner,
-                                          style=TaskWidgetStyle(color_palette=self._style.color_palette,
-                                                                font=self._style.font,
-                                                                style_name=self._style.style_name),
-                                          widget_spacing=15
-                                          )
-                self.layout.addWidget(widget)
-                self.task_widgets += [widget]
+        self._added_tasks, self._removed_tasks = [], []
+        self._full_refresh = False
+        missing, stale = diff_task_widgets(self.planner.tasks, self.task_widgets)
+        self._update_task_widgets(missing=missing,
+                                  stale=stale)
+
+    def _update_task_widgets(self,
+                             missing: list,
+                             stale: list):
+        """
+        :param missing: list of :py:class:'taskplanner.tasks.Task'
+            The tasks that need a task widget
+        :param stale: list of :py:class:'taskplanner.gui.tasks.TaskWidgetSimple'
+            The task widgets to be deleted
+        """
+        # E.g., a subtask was added: the top-level task widgets are unchanged, and so are the timelines
+        if not missing and not stale:
+            return
+        self.setUpdatesEnabled(False)
+        # Only build one batch of task widgets per pass, so that the event loop keeps running
+        # while a large planner is being loaded. The remaining widgets are built on the next pass.
+        new_widgets = [TaskWidgetSimple(parent=self,
+                                        task=task,
+                                        planner=self.planner,
+                                        style=self._task_widget_style,
+                                        widget_spacing=15
+                                        )
+                       for task in missing[:TASK_WIDGET_BATCH_SIZE]]
+        # Insert the new widgets before the trailing stretch, in a single pass
+        for widget in new_widgets:
+            self.layout.insertWidget(self.layout.count() - 1, widget)
+        self.task_widgets += new_widgets
+        for widget in new_widgets:
+            self._task_widgets_by_task_id[id(widget.task)] = widget
+        if len(missing) > TASK_WIDGET_BATCH_SIZE:
+            self._added_tasks = missing[TASK_WIDGET_BATCH_SIZE:] + self._added_tasks
+            self._rebuild_timer.start()
         # Remove non-existent tasks
-        for widget in self.task_widgets:
-            if widget.task not in self.planner.tasks:
-                widget.hide()
-                self.task_widgets.remove(widget)
-                self.layout.removeWidget(widget)
-        self.layout.addStretch()
-        self.task_widgets_updated.emit()
+        if stale:
+            stale_ids = {id(widget) for widget in stale}
+            self.task_widgets = [widget for widget in self.task_widgets if id(widget) not in stale_ids]
+        for widget in stale:
+            self._task_widgets_by_task_id.pop(id(widget.task), None)
+            self.layout.removeWidget(widget)
+            widget.disconnect_task()
+            widget.setParent(None)
+            widget.deleteLater()
+        self.setUpdatesEnabled(True)
+        self.updateGeometry()
+        self.task_widgets_updated.emit(added=[widget.task for widget in new_widgets],
+                                       removed=[widget.task for widget in stale])
 
 
 class CalendarWidget(QWidget):
@@ -1766,6 +1653,8 @@ class CalendarWidget(QWidget):
         self._style = style
         self.month_widgets = []
         self.timeline_widgets = []
+        # Top-level timelines, by task id
+        self._timelines_by_task_id = {}
         self._view_type = view_type
         self.view_type_changed = Signal()
         self.timelines_updated = Signal()
@@ -1787,6 +1676,13 @@ class CalendarWidget(QWidget):
         # Month widgets
         self.month_widgets_updated = Signal()
         self.make_month_widgets()
+        # A single observer updates the geometry of all timelines, when the month widgets change
+        self.month_widgets_updated.connect(self.update_timeline_geometries)
+        # Coalesce changes of view type and dates into a single rebuild
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(0)
+        self._update_timer.timeout.connect(self.update_all)
         # Timelines
         self.timelines_layout = QVBoxLayout()
         self.timelines_layout.setSpacing(self.task_list_widget.layout.spacing())
@@ -1794,12 +1690,8 @@ class CalendarWidget(QWidget):
         self.layout.addLayout(self.timelines_layout)
 
         self.make_timelines()
-
-        slots = [slot for slot in self.planner.tasks_changed._slots if
-                 'CalendarWidget.' in str(slot)]
-        for slot in slots:
-            self.planner.tasks_changed.disconnect(slot)
-        self.planner.tasks_changed.connect(lambda **kwargs: self.make_timelines())
+        # Timelines follow the (debounced) task widgets they are attached to
+        self.task_list_widget.task_widgets_updated.connect(self.make_timelines)
 
         self.set_style()
         self.layout.addStretch()
@@ -1826,7 +1718,7 @@ class CalendarWidget(QWidget):
             raise ValueError(f'Invalid  timeline view type {value}.'
                              f' Valid view types are {TIMELINE_VIEW_TYPES}')
         self._view_type = value
-        self.update_all()
+        self._update_timer.start()
         self.view_type_changed.emit()
 
     @property
@@ -1840,7 +1732,7 @@ class CalendarWidget(QWidget):
                         * (self.end_date.year - self.start_date.year) \
                         + (self.end_date.month - self.start_date.month) \
                         + 1
-        self.update_all()
+        self._update_timer.start()
         self.dates_changed.emit()
 
     @property
@@ -1854,419 +1746,769 @@ class CalendarWidget(QWidget):
                         * (self.end_date.year - self.start_date.year) \
                         + (self.end_date.month - self.start_date.month) \
                         + 1
-        self.update_all()
+        self._update_timer.start()
         self.dates_changed.emit()
 
+    def update_timeline_geometries(self, **kwargs):
+        # Walk the top-level timelines and their sub-timelines, and repaint them once
+        self.setUpdatesEnabled(False)
+        widgets = list(self.timeline_widgets)
+        while widgets:
+            widget = widgets.pop()
+            widget.set_geometry()
+            widgets += widget.sub_timelines
+        self.setUpdatesEnabled(True)
+
+    @pyqtSlot()
     def update_all(self):
-        self.make_month_widgets()
-        self.make_timelines()
+        # Month widgets and timelines are rebuilt in one pass, and repainted once at the end.
+        # Updates are disabled on the parent, so that the inner rebuilds can't re-enable them halfway.
+        container = self.parentWidget() if self.parentWidget() is not None else self
+        container.setUpdatesEnabled(False)
+        try:
+            self.make_month_widgets()
+            self.make_timelines()
+        finally:
+            container.setUpdatesEnabled(True)
 
     def make_month_widgets(self):
-        # Make month widget
-        class MonthWidget(QFrame):
-            """
-            This widget contains:
-                - A label containing the month
-                - A set of labels containing the weeks of the month
-            """
+        month_model = _build_month_model(start_date=self.start_date,
+                                         n_months=self.n_months)
+        self.dates = [month_date for month_date, _ in month_model]
+        # First day of each displayed week, in a single list
+        self.week_dates = [week_date for _, weeks in month_model for week_date, _ in weeks]
+        # If the month widgets don't fill in all the available space in 'monthly' view, the timeline geometry
+        # calculations are wrong.
+        month_width = int(SCREEN_WIDTH * 0.13)
+        if self.n_months <= 4 and self.view_type == 'monthly':
+            month_width = int(month_width * 1.5)
+        # Month widgets are reused if they are still displayed, whatever view type they were built for
+        dates = set(self.dates)
+        kept_widgets = {widget.date: widget for widget in self.month_widgets if widget.date in dates}
+        self.setUpdatesEnabled(False)
+        # Delete old month widgets
+        for widget in self.month_widgets:
+            self.month_widgets_layout.removeWidget(widget)
+            if kept_widgets.get(widget.date) is not widget:
+                widget._week_widgets_pending = False
+                widget.setParent(None)
+                widget.deleteLater()
+        # Make new month widgets
+        self.month_widgets = []
+        for count, (month_date, weeks) in enumerate(month_model):
+            widget = kept_widgets.get(month_date)
+            if widget is None:
+                widget = MonthWidget(task_list_widget=self.task_list_widget,
+                                     calendar_widget=self,
+                                     date=month_date,
+                                     parent=self,
+                                     style=self._style,
+                                     fixed_width=month_width,
+                                     weeks=weeks,
+                                     lazy=count >= EAGER_MONTH_WIDGETS)
+            else:
+                if (widget.view_type, widget.fixed_width) != (self.view_type, month_width):
+                    # Lay the reused month widget out again, rather than rebuilding it
+                    widget.set_view_type(fixed_width=month_width,
+                                         lazy=count >= EAGER_MONTH_WIDGETS)
+                    widget.set_style()
+                if count < EAGER_MONTH_WIDGETS:
+                    # A reused month widget may have been deferred
+                    widget.ensure_week_widgets()
+            self.month_widgets.append(widget)
+            self.month_widgets_layout.addWidget(widget)
+        self.setUpdatesEnabled(True)
+        self.month_widgets_updated.emit()
 
-            def __init__(self,
-                         planner: Planner,
-                         task_list_widget: TaskListWidget,
-                         calendar_widget: CalendarWidget,
-                         date: date,
-                         parent: QWidget = None,
-                         style: PlannerWidgetStyle = None):
-                self.planner = Planner
-                self.task_list_widget = task_list_widget
-                self.calendar_widget = calendar_widget
-                self._style = style
-                self.date = date
-                self.week_widgets = []
-                super().__init__(parent=parent)
-                # Layout
-                self.layout = QVBoxLayout(self)
-                self.layout.setAlignment(Qt.AlignCenter)
-                self.setFixedHeight(int(SCREEN_HEIGHT * 0.1))
-                # Month label
-                self.make_label()
-                # Horizontal layout for week widgets
-                self.week_widgets_layout = QHBoxLayout()
-                self.week_widgets_layout.setAlignment(Qt.AlignLeft)
-                self.layout.addLayout(self.week_widgets_layout)
-
-                # Week widgets
-                '''
-                if calendar_widget.view_type in ['weekly',
-                                                 'daily']:
-                    if self._style is not None:
-                        stylesheet = self._style.stylesheets['planner_tab']['calendar_widget']['month_widget']
-                        stylesheet['main'] = stylesheet['main'].replace('border:0.5px', 'border:0px')
-                        stylesheet['label'] = stylesheet['label'].replace(
-                            'background-color:None',
-                            f'background-color:{self._style.color_palette["background 2"]}')
-                        self._style.stylesheets['planner_tab']['calendar_widget']['month_widget'] = stylesheet
-                        set_style(widget=self,
-                                  stylesheets=self._style.stylesheets
-                                  ['planner_tab']
-                                  ['calendar_widget']
-                                  ['month_widget'])
-                        self.layout.setAlignment(Qt.AlignLeft)
-                    self.layout.setContentsMargins(0, 0, 0, 0)
-                    self.week_widgets_layout.setSpacing(0)
-                    self.make_week_widgets()
-                    self.layout.insertStretch(1)
-                else:
-                    if self._style is not None:
-                        stylesheet = self._style.stylesheets['planner_tab']['calendar_widget']['month_widget']
-                        stylesheet['main'] = stylesheet['main'].replace('border:0px', 'border:0.5px')
-                        stylesheet['label'] = stylesheet['label'].replace(f'background-color:{self._style.color_palette["background 2"]}',
-                                                                          'background-color:None')
-                        self._style.stylesheets['planner_tab']['calendar_widget']['month_widget'] = stylesheet
-                        set_style(widget=self,
-                                  stylesheets=self._style.stylesheets
-                                  ['planner_tab']
-                                  ['calendar_widget']
-                                  ['month_widget'])
-                        self.layout.setAlignment(Qt.AlignCenter)
-                    self.setFixedWidth(int(SCREEN_WIDTH*0.13))
-                # Set style
-                if self._style is not None:
-                    set_style(widget=self,
-                              stylesheets=self._style.stylesheets
-                              ['planner_tab']
-                              ['calendar_widget']
-                              ['month_widget'])
-                '''
-                if calendar_widget.view_type in ['weekly',
-                                                 'daily']:
-                    self.layout.setContentsMargins(0, 0, 0, 0)
-                    self.week_widgets_layout.setSpacing(0)
-                    self.make_week_widgets()
-                    self.layout.insertStretch(1)
-                else:
-                    self.setFixedWidth(int(SCREEN_WIDTH * 0.13))
-                # Style
-                self.set_style()
+    def build_months_in_range(self,
+                              x_min: int,
+                              x_max: int):
+        """
+        Builds the deferred week widgets of the month widgets that intersect a horizontal range.
+        :param x_min: int
+        :param x_max: int
+            The limits of the range, in the coordinates of this widget
+        """
+        pending = [widget for widget in self.month_widgets
+                   if widget._week_widgets_pending
+                   and widget.x() <= x_max and widget.x() + widget.width() >= x_min]
+        if not pending:
+            return
+        # The months are built in a single repaint of this widget
+        self.setUpdatesEnabled(False)
+        try:
+            for widget in pending:
+                widget.ensure_week_widgets()
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def make_timelines(self,
+                       added: list = None,
+                       removed: list = None,
+                       **kwargs):
+        """
+        Adds and removes top-level timelines, so that each task widget of the task list widget has one.
+        :param added: list of :py:class:'taskplanner.tasks.Task', optional
+            The tasks whose task widgets were just built. By default, all tasks of the planner are checked.
+        :param removed: list of :py:class:'taskplanner.tasks.Task', optional
+            The tasks whose task widgets were just deleted. By default, all timelines are checked.
+        """
+        # Only changes to the task widgets affect which timelines exist
+        if added is not None and removed is not None and not added and not removed:
+            return
+        # Add and remove all timelines before repainting
+        self.setUpdatesEnabled(False)
+        tasks = added if added is not None else self.planner.tasks
+        task_widgets = self.task_list_widget._task_widgets_by_task_id
+        for task in tasks:
+            if id(task) in self._timelines_by_task_id:
+                continue
+            task_widget = task_widgets.get(id(task))
+            # The task widget may not have been built yet
+            if task_widget is None:
+                continue
+            widget = Timeline(task_widget=task_widget,
+                              calendar_widget=self,
+                              parent=self,
+                              style=self._style,
+                              add_to_timelines_layout=True)
+            self.timeline_widgets.append(widget)
+            self._timelines_by_task_id[id(task)] = widget
+            widget.ensure_sub_timelines()
+            if task_widget.task.is_top_level:
+                widget.show()
+
+        # Remove non-existent timelines and all of those related to descendant tasks,
+        # i.e., the sub-timelines that have been built below them
+        if removed is not None:
+            stale = [self._timelines_by_task_id[id(task)] for task in removed
+                     if id(task) in self._timelines_by_task_id]
+        else:
+            planner_tasks = {id(task) for task in self.planner.tasks}
+            stale = [widget for widget in self.timeline_widgets if id(widget.task) not in planner_tasks]
+        for widget in stale:
+            self._timelines_by_task_id.pop(id(widget.task), None)
+            widget.disconnect_task()
+            for w in widget.all_timelines():
+                self.timelines_layout.removeWidget(w)
+                w.setParent(None)
+                w.deleteLater()
+        if stale:
+            stale_ids = {id(widget) for widget in stale}
+            self.timeline_widgets = [widget for widget in self.timeline_widgets if id(widget) not in stale_ids]
+        self.setUpdatesEnabled(True)
+        self.timelines_updated.emit()
 
-            def set_style(self, style: PlannerWidgetStyle = None):
-                self._style = style if style is not None else self._style
-                stylesheet = self._style.stylesheets['planner_tab']['calendar_widget']['month_widget']
-                if self._style is not None:
-                    if self.calendar_widget.view_type in ['weekly',
-                                                          'daily']:
-                        stylesheet['main'] = stylesheet['main'].replace('border:0.5px', 'border:0px')
-                        stylesheet['label'] = stylesheet['label'].replace(
-                            'background-color:None',
-                            f'background-color:{self._style.color_palette["background 2"]}')
-                        self._style.stylesheets['planner_tab']['calendar_widget']['month_widget'] = stylesheet
-                        self.layout.setAlignment(Qt.AlignLeft)
-                    else:
-                        if (self.date.year, self.date.month) == (date.today().year, date.today().month): # Highlight today's month
-                            color_old = 'None',
-                            color_new = self._style.color_palette['background 2']
-                            stylesheet['main'] = stylesheet['main'].replace(
-                                f'background-color:{color_old}',
-                                f'background-color:{color_new}')
-                        stylesheet['label'] = stylesheet['label'].replace(
-                            f'background-color:{self._style.color_palette["background 2"]}',
-                            f'background-color:None')
-                        stylesheet['main'] = stylesheet['main'].replace('border:0px', 'border:0.5px')
-                        self._style.stylesheets['planner_tab']['calendar_widget']['month_widget'] = stylesheet
-                        self.layout.setAlignment(Qt.AlignCenter)
-                    set_style(widget=self,
-                              stylesheets=self._style.stylesheets
-                              ['planner_tab']
-                              ['calendar_widget']
-                              ['month_widget'])
-                    for widget in self.week_widgets:
-                        widget.set_style(self._style)
 
-            def make_label(self):
-                self.label = QLabel()
-                if self.calendar_widget.view_type in ['weekly', 'daily']:
-                    self.label.setContentsMargins(10, 0, 0, 0)
-                # Layout
-                self.layout.addWidget(self.label)
-                self.label.setAlignment(Qt.AlignLeft)
-                self.label.setAlignment(Qt.AlignVCenter)
-                # Set text
-                self.label.setText(self.date.strftime('%B %Y'))
+class Timeline(QFrame):
+    """
+    This widget contains a label which:
+        - Has the same color as the associated task. Its color must follow the associated
+          task's color.
+        - Has same vertical position as the associated task in the task list widget.
+          Its position must change whenever the vertical position of the associated
+          task changes. In particular, if the associated task is hidden or shown
+          in the task list widget of the planner, so must the timeline be hidden or shown.
+          Similarly, if the task is removed from the planner.
+        - Has position and a horizontal extension such that it matches the start and end date
+          of the associated task, according to the CalendarWidget that contains it.
+          Its geometry must change whenever the start or end date of the task change, and
+          whenever the planner view type is changed (e.g., from daily to weekly)
+    """
 
-            def make_week_widgets(self):
-                class WeekWidget(QFrame):
-                    """
-                    This widget contains:
-                        - A label containing the week
-                        - A set of labels containing the days of the week
-                    """
+    def __init__(self,
+                 task_widget: TaskWidgetSimple,
+                 calendar_widget: CalendarWidget,
+                 parent: QWidget = None,
+                 style: PlannerWidgetStyle = None,
+                 add_to_timelines_layout: bool = False):
+        self.task_widget = task_widget
+        self.planner = self.task_widget.planner
+        self.task = self.task_widget.task
+        self.calendar_widget = calendar_widget
+        self._style = style
+        self.start_position_changed = Signal()
+        self.length_changed = Signal()
+        self.dragging_mode = None # 'start' or 'end'
+        super().__init__(parent=parent)
+        # Layout
+        self.layout = QVBoxLayout(self)
+        self.setContentsMargins(0, 0, 0, 0)
+        self.layout.setContentsMargins(0, 0, 0, 0)
+        if add_to_timelines_layout and hasattr(self.parent(), 'timelines_layout'):
+            self.parent().timelines_layout.addWidget(self)
+        self.setFixedHeight(self.task_widget.task_line_widget.height())
+        # Horizontal layout for label
+        self.label_layout = QHBoxLayout()
+        self.label_layout.setAlignment(Qt.AlignLeft)
+        self.layout.addLayout(self.label_layout)
+        # Insert first spacing. It is kept for the lifetime of the timeline and resized by set_start_position
+        self.label_layout.insertSpacing(0, 0)
+        self.start_spacer = self.label_layout.itemAt(0).spacerItem()
+        # Sub-timelines
+        self.sub_timelines = []
+        self._sub_timelines_pending = False
+        # Label pushbutton
+        self.make_label_pushbutton()
+        # Sub-timelines are built by ensure_sub_timelines, once this timeline is in place in the layout
+        self._sub_timelines_pending = True
+        self.task.children_changed.disconnect(self.make_sub_timelines)
+        self.task.children_changed.connect(self.make_sub_timelines)
 
-                    def __init__(self,
-                                 planner: Planner,
-                                 task_list_widget: TaskListWidget,
-                                 calendar_widget: CalendarWidget,
-                                 date: date,
-                                 parent: QWidget = None,
-                                 style: PlannerWidgetStyle = None):
-                        self.planner = Planner
-                        self.task_list_widget = task_list_widget
-                        self.calendar_widget = calendar_widget
-                        self._style = style
-                        self.date = date
-                        self.dates = []
-                        self.day_widgets = []
-                        super().__init__(parent=parent)
-                        # Layout
-                        self.layout = QVBoxLayout(self)
-                        self.layout.setAlignment(Qt.AlignTop)
-                        # Week label
-                        self.make_label()
-                        # Horizontal layout for week widgets
-                        self.day_widgets_layout = QHBoxLayout()
-                        self.day_widgets_layout.setAlignment(Qt.AlignLeft)
-                        self.layout.addLayout(self.day_widgets_layout)
-                        # Day widgets
-                        if calendar_widget.view_type == 'daily':
-                            self.layout.setContentsMargins(0, 0, 0, 0)
-                            self.day_widgets_layout.setSpacing(0)
-                            self.make_day_widgets()
-                        else:
-                            self.setFixedWidth(int(SCREEN_WIDTH * 0.05))
-                        # Style
-                        self.set_style()
+        # Style
+        self.set_style()
 
-                    def set_style(self, style: PlannerWidgetStyle = None):
-                        self._style = style if style is not None else self._style
-                        if self._style is not None:
-                            stylesheet = self._style.stylesheets['planner_tab']['calendar_widget']['week_widget']
-                            if self.calendar_widget.view_type == 'daily':
-                                stylesheet['main'] = stylesheet['main'].replace('border:0.5px', 'border:0px')
-                                self._style.stylesheets['planner_tab']['calendar_widget']['week_widget'] = stylesheet
-                                self.layout.setAlignment(Qt.AlignLeft)
-                            else:
-                                today = date.today()
-                                this_sunday = today + relativedelta(days=7 - today.weekday())
-                                if today <= self.date <= this_sunday:  # Highlight today's week
-                                    color_old = 'None',
-                                    color_new = self._style.color_palette['background 2']
-                                else:
-                                    color_new = 'None',
-                                    color_old = self._style.color_palette['background 2']
-                                stylesheet['main'] = stylesheet['main'].replace(
-                                    f'background-color:{color_old}',
-                                    f'background-color:{color_new}')
-                                stylesheet['label'] = stylesheet['label'].replace(
-                                    f'background-color:{self._style.color_palette["background 2"]}',
-                                    f'background-color:None')
-                                stylesheet['main'] = stylesheet['main'].replace('border:0px', 'border:0.5px')
-                                self._style.stylesheets['planner_tab']['calendar_widget']['week_widget'] = stylesheet
-                                self.layout.setAlignment(Qt.AlignCenter)
+    def set_style(self, style: PlannerWidgetStyle = None):
+        self._style = style if style is not None else self._style
+        if self._style is not None:
+            set_style(widget=self,
+                      stylesheets=self._style.stylesheets
+                      ['planner_tab']
+                      ['calendar_widget']
+                      ['timeline']['main'])
+            self.set_color()
+            for widget in self.sub_timelines:
+                widget.set_style(self._style)
 
-                            set_style(widget=self,
-                                      stylesheets=self._style.stylesheets
-                                      ['planner_tab']
-                                      ['calendar_widget']
-                                      ['week_widget'])
-                            for widget in self.day_widgets:
-                                widget.set_style(self._style)
+    def make_label_pushbutton(self):
+        self.label_pushbutton = QPushButton()
+        # Layout
+        self.label_layout.addWidget(self.label_pushbutton)
+        self.set_height()
+
+        def clicked():
+            task_widget = TaskWidget(task=self.task,
+                                     planner=self.planner,
+                                     style=TaskWidgetStyle(color_palette=self._style.color_palette,
+                                                           font=self._style.font,
+                                                           style_name=self._style.style_name))
+            task_widget.show()
+
+        # Connect task and widget
+        self.label_pushbutton.installEventFilter(self)
+        # Set initial text
+        self.update_label()
+        # Set geometry. It is also updated by the calendar widget, when its month widgets change
+        self.set_geometry()
+        # Set visibility
+        self.set_visibility()
+        # Connect bound methods rather than closures, so that they can be disconnected
+        # Background color and border follow the task's color (they are first set by set_style)
+        self.task.name_changed.connect(self.update_label)
+        self.task.color_changed.connect(self.set_color)
+        self.task.start_date_changed.connect(self.set_geometry)
+        self.task.end_date_changed.connect(self.set_geometry)
+        self.task_widget.visibility_changed.connect(self.set_visibility)
+
+    def disconnect_task(self):
+        """
+        Disconnects this timeline and its sub-timelines from their tasks, when they are removed from the calendar.
+        """
+        self.task.name_changed.disconnect(self.update_label)
+        self.task.color_changed.disconnect(self.set_color)
+        self.task.start_date_changed.disconnect(self.set_geometry)
+        self.task.end_date_changed.disconnect(self.set_geometry)
+        self.task_widget.visibility_changed.disconnect(self.set_visibility)
+        self.task.children_changed.disconnect(self.make_sub_timelines)
+        for widget in self.sub_timelines:
+            widget.disconnect_task()
+
+    def update_label(self, **kwargs):
+        self.label_pushbutton.setText(f'({len(self.task.ancestors)}) {self.task.name}')
+
+    def set_color(self, **kwargs):
+        # The label has a style sheet, so its color can only be set through it
+        set_style_sheet(self.label_pushbutton,
+                        _timeline_label_stylesheet(color=self.task.color,
+                                                   font_size=self._style.font['size - text - small']))
+
+    def set_height(self):
+        self.label_pushbutton.setFixedHeight(self.task_widget.task_line_widget.height())
+
+    def set_start_position(self):
+        calendar_widget, start_date = self.calendar_widget, self.task.start_date
+        first_month_widget = calendar_widget.month_widgets[0]
+        view_type = calendar_widget.view_type
+        spacing = 0
+        if view_type == 'daily':
+            day_width = first_month_widget.week_widgets[0].day_widgets[0].width()
+            n_day_widths = (start_date - first_month_widget.date).days
+            spacing = n_day_widths * day_width
+        elif view_type == 'weekly':
+            week_width = first_month_widget.week_widgets[0].width()
+            # Count weeks from the month model: the week widgets may not have been built yet.
+            # The week dates are sorted, so they are counted by bisection.
+            n_weeks = bisect_right(calendar_widget.week_dates, start_date)
+            n_weeks = n_weeks - 1 + (start_date.weekday()) / 7
+            spacing = int(week_width * n_weeks)
+        elif view_type == 'monthly':
+            month_width = first_month_widget.width()
+            # Count the months starting on or before the start date, among the sorted month dates
+            n_months = bisect_right(calendar_widget.dates, start_date) - 1
+            month_date = calendar_widget.month_widgets[n_months].date
+            n_days_in_month = calendar.monthrange(month_date.year, month_date.month)[1]
+            n_months = n_months + (start_date.day - 1) / n_days_in_month
+            spacing = int(n_months * month_width)
+        # Resize the left spacing, rather than replacing it
+        if spacing != self.start_spacer.sizeHint().width():
+            self.start_spacer.changeSize(spacing, 0, QSizePolicy.Fixed, QSizePolicy.Minimum)
+            self.label_layout.invalidate()
+        self.start_position_changed.emit()
+
+    def get_start_date(self,
+                       start_position: int = None):
+        start_position = start_position if start_position is not None else self.label_pushbutton.x()
+        return self.get_date(position=start_position)
+
+
+    def get_date(self,
+                 position: int):
+        if self.calendar_widget.view_type == 'daily':
+            day_width = self.calendar_widget.month_widgets[0].week_widgets[0].day_widgets[0].width()
+            n_days = int(ceil(position / day_width)) - 1
+            dt = self.calendar_widget.start_date + timedelta(days=n_days)
+        elif self.calendar_widget.view_type == 'weekly':
+            month_width = self.calendar_widget.month_widgets[0].width()
+            week_width = self.calendar_widget.month_widgets[0].week_widgets[0].width()
+            month_index = int(position / month_width)
+            month_widget = self.calendar_widget.month_widgets[month_index]
+            week_index = int((position - month_index * month_width) / week_width)
+            total_width = month_index * month_width + week_index * week_width
+            week_fraction = (position - total_width) / week_width
+            week_date = month_widget.weeks[week_index][0]
+            dt = week_date + timedelta(days=int(7*week_fraction))
+        elif self.calendar_widget.view_type == 'monthly':
+            month_width = self.calendar_widget.month_widgets[0].width()
+            month_index = int(position / month_width)
+            total_width = month_index * month_width
+            month_fraction = (position - total_width) / month_width
+            month_date = self.calendar_widget.month_widgets[month_index].date
+            n_days_in_month = int((calendar.monthrange(month_date.year, month_date.month)[1] - 1) * month_fraction)
+            dt = month_date + timedelta(days=n_days_in_month)
+        return dt
+
+
+    def set_length(self):
+        calendar_widget = self.calendar_widget
+        start_date, end_date = self.task.start_date, self.task.end_date
+        first_month_widget = calendar_widget.month_widgets[0]
+        view_type = calendar_widget.view_type
+        if view_type == 'daily':
+            day_width = first_month_widget.week_widgets[0].day_widgets[0].width()
+            n_days = (end_date - start_date).days + 1
+            self.label_pushbutton.setFixedWidth(max([0, day_width*n_days]))
+        elif view_type == 'weekly':
+            week_width = first_month_widget.week_widgets[0].width()
+            # Count the weeks starting after the start date and up to the end date, by bisection
+            n_weeks = bisect_right(calendar_widget.week_dates, end_date) \
+                      - bisect_right(calendar_widget.week_dates, start_date)
+            n_weeks = max([0, n_weeks]) + (end_date.weekday() - start_date.weekday() + 1) / 7
+            self.label_pushbutton.setFixedWidth(max([0, int(week_width * n_weeks)]))
+        elif view_type == 'monthly':
+            month_width = first_month_widget.width()
+            # Count the months starting after the start date and up to the end date, by bisection
+            n_months = bisect_right(calendar_widget.dates, end_date) \
+                       - bisect_right(calendar_widget.dates, start_date)
+            n_months = max([0, n_months]) + (end_date.day - start_date.day + 1) / 30
+            self.label_pushbutton.setFixedWidth(max([0, int(n_months * month_width)]))
+
+        self.length_changed.emit()
+
+    def get_end_date(self,
+                     end_position: int = None):
+        end_position = end_position if end_position is not None \
+            else (self.label_pushbutton.x() + self.label_pushbutton.width())
+        return self.get_date(position=end_position)
+
+    def set_geometry(self, **kwargs):
+        self.set_start_position()
+        self.set_length()
+
+    def eventFilter(self, obj, event):
+        """
+        This function allows to handle all kinds of events for all subwidgets in this widget.
+        :param obj:
+        :param event:
+        :return:
+        """
+        if obj == self.label_pushbutton:
+            if event.type() == QEvent.MouseButtonDblClick:
+                task_widget = TaskWidget(task=self.task,
+                                         planner=self.planner,
+                                         style=TaskWidgetStyle(color_palette=self._style.color_palette,
+                                                               font=self._style.font,
+                                                               style_name=self._style.style_name))
+
+                task_widget.show()
+            elif event.type() == QEvent.MouseButtonPress:
+                if event.pos().x() < self.label_pushbutton.width() / 2:
+                    self.dragging_mode = 'start'
+                else:
+                    self.dragging_mode = 'end'
+                self.label_pushbutton.setMouseTracking(True)
+            elif event.type() == QEvent.MouseMove and self.label_pushbutton.hasMouseTracking():
+                if self.dragging_mode == 'start':
+                    start_date = self.get_start_date(self.label_pushbutton.x() + event.pos().x())
+                    try:
+                        self.task.start_date = start_date
+                    except ValueError:
+                        pass
+                else:
+                    end_date = self.get_end_date(self.label_pushbutton.x() + event.pos().x())
+                    try:
+                        self.task.end_date = end_date
+                    except ValueError:
+                        pass
+            elif event.type() == QEvent.MouseButtonRelease:
+                self.label_pushbutton.setMouseTracking(False)
+            elif event.type() == QEvent.HoverEnter:
+                # Effect
+                self.effect = QGraphicsDropShadowEffect()
+                self.effect.setColor(QColor('#121214'))
+                self.effect.setBlurRadius(15)
+                self.label_pushbutton.setGraphicsEffect(self.effect)
+                self.task_widget.task_line_widget.setGraphicsEffect(self.effect)
+            elif event.type() == QEvent.HoverLeave:
+                self.label_pushbutton.setGraphicsEffect(None)
+                self.task_widget.task_line_widget.setGraphicsEffect(None)
+
+        elif obj == self.task_widget.task_line_widget:
+            if event.type() == QEvent.HoverEnter:
+                # Effect
+                self.effect = QGraphicsDropShadowEffect()
+                self.effect.setColor(QColor('#121214'))
+                self.effect.setBlurRadius(15)
+                self.label_pushbutton.setGraphicsEffect(self.effect)
+                self.task_widget.task_line_widget.setGraphicsEffect(self.effect)
+            elif event.type() == QEvent.HoverLeave:
+                self.label_pushbutton.setGraphicsEffect(None)
+                self.task_widget.task_line_widget.setGraphicsEffect(None)
+
+        return super().eventFilter(obj, event)
+
+    def set_visibility(self, **kwargs):
+        self.setVisible(self.task_widget.isVisible())
+        self.ensure_sub_timelines()
+
+    def ensure_sub_timelines(self):
+        """
+        Builds the sub-timelines, if they have not been built yet and the task widget is shown.
+        The sub-timelines of collapsed tasks are only built when the task is expanded.
+        The task tree is walked with a stack rather than recursively, however deep it is.
+        """
+        timelines = [self]
+        while timelines:
+            widget = timelines.pop()
+            if widget._sub_timelines_pending and widget.task_widget.is_visible:
+                widget._sub_timelines_pending = False
+                timelines += widget._update_sub_timelines()
+
+    def all_timelines(self):
+        """
+        :return: list of :py:class:'Timeline'
+            This timeline and all the sub-timelines built below it
+        """
+        timelines = []
+        stack = [self]
+        while stack:
+            widget = stack.pop()
+            timelines.append(widget)
+            stack += widget.sub_timelines
+        return timelines
+
+    def make_sub_timelines(self, **kwargs):
+        if self._sub_timelines_pending:
+            # The sub-timelines will be built from the current subtasks, when needed
+            return
+        for widget in self._update_sub_timelines():
+            widget.ensure_sub_timelines()
+
+    def _update_sub_timelines(self):
+        """
+        Adds and removes the sub-timelines of this timeline only, so that each subtask has one.
+        :return: list of :py:class:'Timeline'
+            The new sub-timelines
+        """
+        l = self.calendar_widget.timelines_layout
+        # Remove non-existent sub-timelines, along with the sub-timelines built below them
+        children = {id(subtask) for subtask in self.task.children}
+        for widget in self.sub_timelines:
+            if id(widget.task) not in children:
+                widget.disconnect_task()
+                for w in widget.all_timelines():
+                    l.removeWidget(w)
+                    w.setParent(None)
+                    w.deleteLater()
+        self.sub_timelines = [widget for widget in self.sub_timelines if id(widget.task) in children]
+        # Add new sub-timelines
+        sub_timelines = {id(widget.task): widget for widget in self.sub_timelines}
+        subtask_widgets = {id(w.task): w for w in self.task_widget.subtask_widgets}
+        # Position of the next subtask in the timelines layout. The sub-timelines of
+        # the new sub-timelines are inserted right below them, once they are built
+        index = l.indexOf(self) + 1
+        new_sub_timelines = []
+        for subtask in self.task.children:
+            sub_timeline = sub_timelines.get(id(subtask))
+            if sub_timeline is None:
+                subtask_widget = subtask_widgets[id(subtask)]
+                sub_timeline = Timeline(task_widget=subtask_widget,
+                                        calendar_widget=self.calendar_widget,
+                                        parent=self.parent(),
+                                        style=self._style,
+                                        add_to_timelines_layout=True)
+                # Move the sub-timeline from the end of the main timelines layout to its position
+                l.removeWidget(sub_timeline)
+                l.insertWidget(index, sub_timeline)
+                self.sub_timelines += [sub_timeline]
+                new_sub_timelines += [sub_timeline]
+            index += len(sub_timeline.all_timelines())
+        return new_sub_timelines
+
+
+class PlannerTab(QWidget):
+    """
+    This widget contains:
+        - On the left, a widget containing vertical list of :py:class:'taskplanner.gui.TaskWidgetSimple' of top-level tasks
+        - On the right, a widget containing timelines corresponding to each task and its related subtasks
+    """
+    def __init__(self,
+                 planner: Planner,
+                 parent: QWidget = None,
+                 style: PlannerWidgetStyle = DEFAULT_PLANNER_STYLE
+                 ):
+        """
+        :param planner: :py:class:'taskplanner.planner.Planner'
+            The planner associated to this widget
+        :param parent: :py:class:'QWidget', optional
+            The parent widget
+        """
+        self.planner, self._style = planner, style
+        super().__init__(parent=parent)
+        # Layout
+        self.layout = QVBoxLayout(self)
+        self.layout.setAlignment(Qt.AlignTop)
+        # Geometry
+        self.setGeometry(self.parent().geometry())
+        # Horizontal layout for (new task textedit, planner settings)
+        self.new_task_settings_layout = QHBoxLayout()
+        self.new_task_settings_layout.setAlignment(Qt.AlignLeft)
+        self.layout.addLayout(self.new_task_settings_layout)
+        # New task textedit
+        self.make_new_task_textedit()
+        self.new_task_textedit.setFixedSize(int(self.width() * 0.15),
+                                            int(self.height() * 0.035))
+        # Upload task pushbutton
+        self.make_upload_task_pushbutton()
+        self.upload_task_pushbutton.setFixedSize(int(self.upload_task_pushbutton.iconSize().width()*2),
+                                                 int(self.upload_task_pushbutton.iconSize().height()*2))
+        self.new_task_settings_layout.addSpacing(int(SCREEN_WIDTH * 0.35)
+                                                 - self.new_task_textedit.width()
+                                                 - self.upload_task_pushbutton.width())
+        # Vertical layout for task list widget
+        self.task_list_layout = QVBoxLayout()
+        self.task_list_layout.setAlignment(Qt.AlignTop)
+        # Horizontal layout for calendar widget
+        self.calendar_layout = QHBoxLayout()
+        self.calendar_layout.setAlignment(Qt.AlignLeft)
+        self.layout.addLayout(self.calendar_layout)
+        self.calendar_layout.addLayout(self.task_list_layout)
+        # Horizontal layout for task list and timelines
+        self.task_timelines_layout = QHBoxLayout()
+        self.task_timelines_layout.setAlignment(Qt.AlignLeft)
+        self.layout.addLayout(self.task_timelines_layout)
+        # Task list widget
+        self.make_task_list_widget()
+        ## Scroll area
+        ## (the scroll areas only resize their widgets once all children are in place)
+        self.task_list_scrollarea = QScrollArea()
+        self.task_list_scrollarea.setWidget(self.task_list_widget)
+        self.task_list_layout.addWidget(self.task_list_scrollarea)
+        self.task_list_scrollarea.setFixedWidth(int(SCREEN_WIDTH * 0.35))
+        # Calendar widget
+        self.make_calendar_widget()
+        ## Scroll area
+        self.calendar_scrollarea = QScrollArea()
+        self.calendar_scrollarea.setWidget(self.calendar_widget)
+        self.calendar_layout.addWidget(self.calendar_scrollarea)
+        # Build the months about to be scrolled into view, up to one viewport ahead
+        self.calendar_scrollarea.horizontalScrollBar().valueChanged.connect(
+            lambda value: self.calendar_widget.build_months_in_range(
+                x_min=value,
+                x_max=value + 2 * self.calendar_scrollarea.viewport().width()))
+        self.task_timelines_layout.addLayout(self.calendar_widget.timelines_layout)
+        # Adjust task list widget vertical position
+        self.task_list_layout.insertSpacing(0,
+                                            self.calendar_widget.month_widgets[0].height())
+        # View selector
+        self.make_view_selector()
+        self.view_selector.combobox.setGeometry(
+            _priority_combobox_geometry(style_name=self._style.style_name,
+                                        font=tuple(sorted(self._style.font.items()))))
+        self.view_selector.setFixedSize(int(SCREEN_WIDTH * 0.08),
+                                        int(self.height() * 0.08))
+        # Calendar start and end dates
+        self.make_start_end_dates()
+        date_widget_width, date_widget_height = int(SCREEN_WIDTH * 0.05), int(self.height() * 0.05)
+        self.start_date_widget.setFixedSize(date_widget_width, date_widget_height)
+        self.end_date_widget.setFixedSize(date_widget_width, date_widget_height)
+        # Let the scroll areas resize their (now populated) widgets
+        self.task_list_scrollarea.setWidgetResizable(True)
+        self.calendar_scrollarea.setWidgetResizable(True)
 
-                    def make_label(self):
-                        self.label = QLabel()
-                        if self.calendar_widget.view_type in ['daily']:
-                            self.label.setContentsMargins(10, 0, 0, 0)
-                        # Layout
-                        self.layout.addWidget(self.label)
-                        self.label.setAlignment(Qt.AlignVCenter)
-                        # Set text
-                        self.label.setText(self.date.strftime('Week %W'))
+        self.set_style()
+        # Lock the vertical scrollbars of the timelines and the task list
+        self.calendar_scrollarea.setVerticalScrollBar(self.task_list_scrollarea.verticalScrollBar())
 
-                    def make_day_widgets(self):
-                        class DayWidget(QFrame):
-                            """
-                            This widget contains:
-                                - A label containing the day
-                            """
+        self.task_timelines_layout.setSpacing(0)
 
-                            def __init__(self,
-                                         planner: Planner,
-                                         task_list_widget: TaskListWidget,
-                                         date: date,
-                                         parent: QWidget = None,
-                                         style: PlannerWidgetStyle = None):
-                                self.planner = Planner
-                                self.task_list_widget = task_list_widget
-                                self._style = style
-                                self.date = date
-                                super().__init__(parent=parent)
-                                # Layout
-                                self.layout = QVBoxLayout(self)
-                                self.layout.setAlignment(Qt.AlignTop)
-                                self.setFixedWidth(int(SCREEN_WIDTH*0.04))
-                                # Day label
-                                self.make_label()
-                                # Set style
-                                self.set_style()
+    def set_style(self, style: PlannerWidgetStyle = None):
+        self._style = style if style is not None else self._style
+        if self._style is not None:
+            set_style(widget=self,
+                      stylesheets=self._style.stylesheets
+                      ['planner_tab']['main'])
+            set_style(widget=self.task_list_scrollarea,
+                      stylesheets=self._style.stylesheets
+                      ['planner_tab']['task_list_scrollarea'])
+            set_style(widget=self.task_list_widget,
+                      stylesheets=self._style.stylesheets
+                      ['planner_tab']['task_list_widget'])
+            set_style(widget=self.calendar_scrollarea,
+                      stylesheets=self._style.stylesheets
+                      ['planner_tab']['calendar_scrollarea'])
+            set_style(widget=self.new_task_textedit,
+                      stylesheets=self._style.stylesheets
+                      ['planner_tab']['new_task_textedit'])
+            set_style(widget=self.upload_task_pushbutton,
+                      stylesheets=self._style.stylesheets
+                      ['planner_tab']
+                      ['upload_task_pushbutton'])
+            self.task_list_widget.set_style(self._style)
+            self.calendar_widget.set_style(self._style)
+            self.view_selector.set_style(self._style)
+            self.start_date_widget.set_style(self._style)
+            self.end_date_widget.set_style(self._style)
 
-                            def set_style(self, style: PlannerWidgetStyle = None):
-                                self._style = style if style is not None else self._style
-                                if self._style is not None:
-                                    stylesheet = self._style.stylesheets['planner_tab']['calendar_widget']['day_widget']
-                                    if self.date == date.today():  # Highlight today
-                                        color_old = 'None',
-                                        color_new = self._style.color_palette['background 2']
-                                    else:
-                                        color_new = 'None',
-                                        color_old = self._style.color_palette['background 2']
-                                    stylesheet['main'] = stylesheet['main'].replace(
-                                        f'background-color:{color_old}',
-                                        f'background-color:{color_new}')
-                                    self._style.stylesheets['planner_tab']['calendar_widget']['day_widget'] = stylesheet
-                                    set_style(widget=self,
-                                              stylesheets=self._style.stylesheets
-                                              ['planner_tab']
-                                              ['calendar_widget']
-                                              ['day_widget'])
 
+    def make_new_task_textedit(self):
+        # textedit to define a new task when the return key is pressed
+        self.new_task_textedit = QTextEdit()
+        # Layout
+        self.new_task_settings_layout.addWidget(self.new_task_textedit)
+        # The return key is handled in eventFilter, so no work is done on other keystrokes
+        self.new_task_textedit.installEventFilter(self)
+        self.new_task_textedit.setPlaceholderText("+ New Task")
+
+    def add_new_task(self):
+        name = self.new_task_textedit.toPlainText()
+        # No task is made from an empty text edit
+        if not name.strip():
+            return
+        new_task = Task(name=name)
+        self.new_task_textedit.clear()
+        # Add new task
+        self.planner.add_tasks(new_task)
+
+    def eventFilter(self, obj, event):
+        """
+        This function allows to handle all kinds of events for all subwidgets in this widget.
+        :param obj:
+        :param event:
+        :return:
+        """
+        if obj == self.new_task_textedit:
+            # Shift+Return inserts a new line instead
+            if (event.type() == QEvent.KeyPress
+                and event.key() in (Qt.Key_Return, Qt.Key_Enter)
+                and not (event.modifiers() & Qt.ShiftModifier)):
+                self.add_new_task()
+                # Do not insert the new line
+                return True
+
+        return super().eventFilter(obj, event)
+
+    def make_upload_task_pushbutton(self):
+        self.upload_task_pushbutton = QPushButton()
+        self.new_task_settings_layout.addWidget(self.upload_task_pushbutton)
+        # Icon
+        icon_path = self._style.icon_path
+        icon_filename = os.path.join(icon_path, 'upload.png')
+        self.upload_task_pushbutton.setIcon(get_icon(icon_filename))
+
+        # User interactions
+        def callback():
+            # Show the new textedit
+            filename = select_file(title=f'Select the File Containing the Task to Be Uploaded')
+            try:
+                self.planner.add_tasks(Task.from_file(filename=filename))
+            except Exception as e:
+                print(e)
+
+        self.upload_task_pushbutton.clicked.connect(callback)
+
+
+    def make_view_selector(self):
+        self.view_selector = ViewSelector(calendar_widget=self.calendar_widget,
+                                          parent=self,
+                                          style=self._style)
+        self.new_task_settings_layout.addWidget(self.view_selector)
 
-                            def make_label(self):
-                                self.label = QLabel()
-                                # Layout
-                                self.layout.addWidget(self.label)
-                                self.label.setAlignment(Qt.AlignCenter)
-                                # Set text
-                                self.label.setText(self.date.strftime('%A')[:3]
-                                                   + ' ' + str(self.date.day))
-
-                        self.dates = []
-                        self.day_widgets = []
-                        import calendar
-                        is_day_of_week, is_day_of_month = True, True
-                        self.n_days = 0
-
-                        while is_day_of_week and is_day_of_month:
-                            d = self.date + relativedelta(days=self.n_days)
-                            if d == self.date:
-                                d_previous = self.date
-                            else:
-                                d_previous = self.date + relativedelta(days=self.n_days - 1)
-                            if d.weekday() % 7 < d_previous.weekday() % 7:
-                                is_day_of_week = False
-                            elif d.month != d_previous.month:
-                                is_day_of_month = False
-                            else:
-                                self.dates += [d]
-                                self.n_days += 1
-                                self.day_widgets += [DayWidget(planner=self.planner,
-                                                               task_list_widget=self.task_list_widget,
-                                                               date=self.dates[-1],
-                                                               parent=self,
-                                                               style=self._style)]
-                                self.day_widgets_layout.addWidget(self.day_widgets[-1])
-
-                self.dates = []
-                self.week_widgets = []
-                is_day_of_month = True
-                d = date(self.date.year,
-                         self.date.month,
-                         1)
-                while is_day_of_month:
-                    self.dates += [d]
-                    self.week_widgets += [WeekWidget(planner=self.planner,
-                                                     task_list_widget=self.task_list_widget,
-                                                     calendar_widget=self.calendar_widget,
-                                                     date=self.dates[-1],
-                                                     parent=self,
-                                                     style=self._style)]
-                    self.week_widgets_layout.addWidget(self.week_widgets[-1])
-                    is_day_of_week = True
-                    while is_day_of_week:
-                        d_previous = date(d.year, d.month, d.day)
-                        d += relativedelta(days=1)
-                        if d.weekday() % 7 < d_previous.weekday() % 7:
-                            is_day_of_week = False
-                        if d.month != self.date.month:
-                            is_day_of_week = False
-                            is_day_of_month = False
 
-        # Delete old month widgets
-        for widget in self.month_widgets:
-            widget.hide()
-            self.layout.removeWidget(widget)
-        # Make new month widgets
-        self.dates = []
-        self.month_widgets = []
-        reference_date = date(self.start_date.year,
-                              self.start_date.month,
-                              1)
-        for count in range(self.n_months):
-            self.dates += [reference_date + relativedelta(months=count)]
-            self.month_widgets += [MonthWidget(planner=self.planner,
-                                               task_list_widget=self.task_list_widget,
-                                               calendar_widget=self,
-                                               date=self.dates[-1],
+    def make_task_list_widget(self):
+        self.task_list_widget = TaskListWidget(planner=self.planner,
                                                parent=self,
-                                               style=self._style)]
-            # If the month widgets don't fill in all the available space in 'monthly' view, the timeline geometry
-            # calculations are wrong.
-            if self.n_months <= 4 and self.view_type == 'monthly':
-                self.month_widgets[-1].setFixedWidth(int(self.month_widgets[-1].width()*1.5))
-            self.month_widgets_layout.addWidget(self.month_widgets[-1])
-        self.month_widgets_updated.emit()
+                                               style=self._style)
 
-    def make_timelines(self):
-        class Timeline(QFrame):
+    def make_calendar_widget(self):
+        self.calendar_widget = CalendarWidget(planner=self.planner,
+                                                task_list_widget=self.task_list_widget,
+                                                parent=self,
+                                                start_date=date.today(),
+                                                end_date=date.today() + relativedelta(months=6),
+                                                style=self._style)
+
+    def make_start_end_dates(self):
+        class DateWidget(QWidget):
             """
-            This widget contains a label which:
-                - Has the same color as the associated task. Its color must follow the associated
-                  task's color.
-                - Has same vertical position as the associated task in the task list widget.
-                  Its position must change whenever the vertical position of the associated
-                  task changes. In particular, if the associated task is hidden or shown
-                  in the task list widget of the planner, so must the timeline be hidden or shown.
-                  Similarly, if the task is removed from the planner.
-                - Has position and a horizontal extension such that it matches the start and end date
-                  of the associated task, according to the CalendarWidget that contains it.
-                  Its geometry must change whenever the start or end date of the task change, and
-                  whenever the planner view type is changed (e.g., from daily to weekly)
+            This widget contains:
+                - An icon symbolizing the type of time mode (start, end, ...)
+                - A label indicating the selected date
+                - A calendar widget that allows the user to select a day
             """
 
             def __init__(self,
-                         task_widget: TaskWidgetSimple,
-                         calendar_widget: CalendarWidget,
+                         planner: Planner,
+                         calendar_timelines_widget: CalendarWidget,
                          parent: QWidget = None,
-                         style: PlannerWidgetStyle = None,
-                         add_to_timelines_layout: bool = False):
-                self.task_widget = task_widget
-                self.planner = self.task_widget.planner
-                self.task = self.task_widget.task
-                self.calendar_widget = calendar_widget
+                         time_mode: str = 'start',
+                         style: PlannerWidgetStyle = None):
+                """
+                :param task: :py:class:'taskplanner.tasks.Task'
+                    The task associated to this widget
+                :param parent: :py:class:'QWidget', optional
+                    The parent widget
+                :param time_mode: str, optional
+                    The time mode, e.g., 'start', 'end'.
+                """
+                TIME_MODES = ['start', 'end']
+                if time_mode not in TIME_MODES:
+                    raise ValueError(
+                        f'Unrecognized time more {time_mode}. Possible time modes are {tuple(TIME_MODES)}')
+                self.planner = planner
+                self.calendar_timelines_widget = calendar_timelines_widget
+                self.time_mode = time_mode
                 self._style = style
-                self.start_position_changed = Signal()
-                self.length_changed = Signal()
-                self.dragging_mode = None # 'start' or 'end'
                 super().__init__(parent=parent)
                 # Layout
-                self.layout = QVBoxLayout(self)
-                self.setContentsMargins(0, 0, 0, 0)
+                self.layout = QVBoxLayout()
+                self.setLayout(self.layout)
                 self.layout.setContentsMargins(0, 0, 0, 0)
-                if add_to_timelines_layout and hasattr(self.parent(), 'timelines_layout'):
-                    self.parent().timelines_layout.addWidget(self)
-                self.setFixedHeight(self.task_widget.task_line_widget.height())
-                # Horizontal layout for label
-                self.label_layout = QHBoxLayout()
-                self.label_layout.setAlignment(Qt.AlignLeft)
-                self.layout.addLayout(self.label_layout)
-                # Insert first spacing
-                self.label_layout.insertSpacing(0, 0)
-                # Label pushbutton
-                self.make_label_pushbutton()
-                # Sub-timelines
-                self.sub_timelines = []
-                self.make_sub_timelines()
-                self.task.children_changed.disconnect(self.make_sub_timelines)
-                self.task.children_changed.connect(self.make_sub_timelines)
-
-                # Style
+                # Label
+                self.make_label()
+                # Label
+                self.make_pushbutton()
+                # Calendar widget
+                self.make_calendar_widget()
                 self.set_style()
 
             def set_style(self, style: PlannerWidgetStyle = None):
@@ -2275,321 +2517,594 @@ class CalendarWidget(QWidget):
                     set_style(widget=self,
                               stylesheets=self._style.stylesheets
                               ['planner_tab']
-                              ['calendar_widget']
-                              ['timeline']['main'])
-                    self.set_color()
-                    for widget in self.sub_timelines:
-                        widget.set_style(self._style)
-
-            def make_label_pushbutton(self):
-                self.label_pushbutton = QPushButton()
+                              [f'{self.time_mode}_date_widget'])
+
+            def make_label(self):
+                self.label = QLabel(f'{self.time_mode.title()} Date')
+                self.layout.addWidget(self.label)
+                self.label.setAlignment(Qt.AlignCenter)
+
+            def make_pushbutton(self):
+                self.pushbutton = QPushButton()
                 # Layout
-                self.label_layout.addWidget(self.label_pushbutton)
-                self.set_height()
+                self.layout.addWidget(self.pushbutton)
+                # Connect tasks and date widget
+                for task in self.planner.tasks:
+                    all_descendants = [task] + list(task.descendants)
+                    for t in all_descendants:
+                        getattr(t, f'{self.time_mode}_date_changed').connect
+                        (lambda **kwargs: self.update_label())
+                self.update_label()
 
                 def clicked():
-                    task_widget = TaskWidget(task=self.task,
-                                             planner=self.planner,
-                                             style=TaskWidgetStyle(color_palette=self._style.color_palette,
-                                                                   font=self._style.font,
-                                                                   style_name=self._style.style_name))
-                    task_widget.show()
-
-                def update_label():
-                    self.label_pushbutton.setText(f'({len(self.task.ancestors)}) {self.task.name}')
-
-                # Connect task and widget
-                self.label_pushbutton.installEventFilter(self)
-                # Set initial text
-                update_label()
-                self.task.name_changed.connect(lambda **kwargs: update_label())
-                # Set background color, border
-                self.set_color()
-                self.task.color_changed.connect(lambda **kwargs: self.set_color())
-                # Set geometry
-                self.set_geometry()
-                self.task.start_date_changed.connect(lambda **kwargs: self.set_geometry())
-                self.task.end_date_changed.connect(lambda **kwargs: self.set_geometry())
-                self.calendar_widget.month_widgets_updated.connect(lambda **kwargs: self.set_geometry())
-                # Set visibility
-                self.set_visibility()
-                self.task_widget.visibility_changed.connect(lambda **kwargs: self.set_visibility())
-
-
-            def set_color(self):
-                style_sheet = '''
-                QPushButton
-                {
-                    background-color:%s;
-                    border:0px solid %s;
-                    font-size:%s;
-                    text-align:left;
-                    padding-left:10px;
-                }
-                QPushButton:hover
-                {
-                    text-decoration:underline;
-                }
-                ''' % (self.task.color,
-                       self.task.color,
-                       self._style.font['size - text - small'])
-                self.label_pushbutton.setStyleSheet(style_sheet)
-
-            def set_height(self):
-                self.label_pushbutton.setFixedHeight(self.task_widget.task_line_widget.height())
-
-            def set_start_position(self):
-                delta_date = self.task.start_date - self.calendar_widget.month_widgets[0].date
-                spacing = 0
-                # Remove spacing
-                self.label_layout.removeItem(self.label_layout.itemAt(0))
-                if self.calendar_widget.view_type == 'daily':
-                    day_width = self.calendar_widget.month_widgets[0].week_widgets[0].day_widgets[0].width()
-                    n_day_widths = delta_date.days
-                    spacing = n_day_widths * day_width
-                elif self.calendar_widget.view_type == 'weekly':
-                    week_width = self.calendar_widget.month_widgets[0].week_widgets[0].width()
-                    month_widgets = [m for m in self.calendar_widget.month_widgets if m.date <= self.task.start_date]
-                    n_weeks = 0
-                    for m in month_widgets:
-                        week_widgets = [w for w in m.week_widgets if w.date <= self.task.start_date]
-                        n_weeks += len(week_widgets)
-                    n_weeks = n_weeks - 1 + (self.task.start_date.weekday()) / 7
-                    spacing = int(week_width * n_weeks)
-                elif self.calendar_widget.view_type == 'monthly':
-                    month_width = self.calendar_widget.month_widgets[0].width()
-
-                    month_widgets = [m for m in self.calendar_widget.month_widgets
-                                     if m.date <= self.task.start_date]
-                    n_months = len(month_widgets) - 1
-                    month_date = self.calendar_widget.month_widgets[n_months].date
-                    n_days_in_month = (month_date + relativedelta(months=1, days=-1)).day
-                    n_months = n_months + (self.task.start_date.day - 1) / n_days_in_month
-                    spacing = int(n_months * month_width)
-                # Add left spacing
-                self.label_layout.insertSpacing(0, spacing)
-                self.start_position_changed.emit()
-
-            def get_start_date(self,
-                               start_position: int = None):
-                start_position = start_position if start_position is not None else self.label_pushbutton.x()
-                return self.get_date(position=start_position)
-
-
-            def get_date(self,
-                         position: int):
-                if self.calendar_widget.view_type == 'daily':
-                    day_width = self.calendar_widget.month_widgets[0].week_widgets[0].day_widgets[0].width()
-                    n_days = int(ceil(position / day_width)) - 1
-                    dt = self.calendar_widget.start_date + relativedelta(days=n_days)
-                elif self.calendar_widget.view_type == 'weekly':
-                    month_width = self.calendar_widget.month_widgets[0].width()
-                    week_width = self.calendar_widget.month_widgets[0].week_widgets[0].width()
-                    month_index = int(position / month_width)
-                    month_widget = self.calendar_widget.month_widgets[month_index]
-                    week_index = int((position - month_index * month_width) / week_width)
-                    total_width = month_index * month_width + week_index * week_width
-                    week_fraction = (position - total_width) / week_width
-                    week = month_widget.week_widgets[week_index]
-                    week_date = week.date
-                    dt = week_date + relativedelta(days=int(7*week_fraction))
-                elif self.calendar_widget.view_type == 'monthly':
-                    month_width = self.calendar_widget.month_widgets[0].width()
-                    month_index = int(position / month_width)
-                    total_width = month_index * month_width
-                    month_fraction = (position - total_width) / month_width
-                    month_date = self.calendar_widget.month_widgets[month_index].date
-                    n_days_in_month = int(((month_date + relativedelta(months=1, days=-1)).day - 1) * month_fraction)
-                    dt = month_date + relativedelta(days=n_days_in_month)
-                return dt
-
-
-            def set_length(self):
-                view_type = self.calendar_widget.view_type
-                if view_type == 'daily':
-                    day_width = self.calendar_widget.month_widgets[0].week_widgets[0].day_widgets[0].width()
-                    n_days = (self.task.end_date - self.task.start_date).days + 1
-                    self.label_pushbutton.setFixedWidth(max([0, day_width*n_days]))
-                elif view_type == 'weekly':
-                    week_width = self.calendar_widget.month_widgets[0].week_widgets[0].width()
-                    month_widgets = [m for m in self.calendar_widget.month_widgets
-                                     if m.date > self.task.start_date - relativedelta(months=1) and m.date <= self.task.end_date + relativedelta(months=1)]
-                    n_weeks = 0
-                    for m in month_widgets:
-                        week_widgets = [w for w in m.week_widgets
-                                        if w.date > self.task.start_date and w.date <= self.task.end_date]
-                        n_weeks += len(week_widgets)
-                    n_weeks = n_weeks + (self.task.end_date.weekday() - self.task.start_date.weekday() + 1) / 7
-                    self.label_pushbutton.setFixedWidth(max([0, int(week_width * n_weeks)]))
-                elif view_type == 'monthly':
-                    month_width = self.calendar_widget.month_widgets[0].width()
-
-                    month_widgets = [m for m in self.calendar_widget.month_widgets
-                                     if m.date > self.task.start_date and m.date <= self.task.end_date]
-                    n_months = len(month_widgets)
-                    n_months = n_months + (self.task.end_date.day - self.task.start_date.day + 1) / 30
-                    self.label_pushbutton.setFixedWidth(max([0, int(n_months * month_width)]))
-
-                self.length_changed.emit()
-
-            def get_end_date(self,
-                             end_position: int = None):
-                end_position = end_position if end_position is not None \
-                    else (self.label_pushbutton.x() + self.label_pushbutton.width())
-                return self.get_date(position=end_position)
-
-            def set_geometry(self):
-                self.set_start_position()
-                self.set_length()
-
-            def eventFilter(self, obj, event):
-                """
-                This function allows to handle all kinds of events for all subwidgets in this widget.
-                :param obj:
-                :param event:
-                :return:
-                """
-                if obj == self.label_pushbutton:
-                    if event.type() == QEvent.MouseButtonDblClick:
-                        task_widget = TaskWidget(task=self.task,
-                                                 planner=self.planner,
-                                                 style=TaskWidgetStyle(color_palette=self._style.color_palette,
-                                                                       font=self._style.font,
-                                                                       style_name=self._style.style_name))
-
-                        task_widget.show()
-                    elif event.type() == QEvent.MouseButtonPress:
-                        if event.pos().x() < self.label_pushbutton.width() / 2:
-                            self.dragging_mode = 'start'
-                        else:
-                            self.dragging_mode = 'end'
-                        self.label_pushbutton.setMouseTracking(True)
-                    elif event.type() == QEvent.MouseMove and self.label_pushbutton.hasMouseTracking():
-                        if self.dragging_mode == 'start':
-                            start_date = self.get_start_date(self.label_pushbutton.x() + event.pos().x())
-                            try:
-                                self.task.start_date = start_date
-                            except ValueError:
-                                pass
-                        else:
-                            end_date = self.get_end_date(self.label_pushbutton.x() + event.pos().x())
-                            try:
-                                self.task.end_date = end_date
-                            except ValueError:
-                                pass
-                    elif event.type() == QEvent.MouseButtonRelease:
-                        self.label_pushbutton.setMouseTracking(False)
-                    elif event.type() == QEvent.HoverEnter:
-                        # Effect
-                        self.effect = QGraphicsDropShadowEffect()
-                        self.effect.setColor(QColor('#121214'))
-                        self.effect.setBlurRadius(15)
-                        self.label_pushbutton.setGraphicsEffect(self.effect)
-                        self.task_widget.task_line_widget.setGraphicsEffect(self.effect)
-                    elif event.type() == QEvent.HoverLeave:
-                        self.label_pushbutton.setGraphicsEffect(None)
-                        self.task_widget.task_line_widget.setGraphicsEffect(None)
-
-                elif obj == self.task_widget.task_line_widget:
-                    if event.type() == QEvent.HoverEnter:
-                        # Effect
-                        self.effect = QGraphicsDropShadowEffect()
-                        self.effect.setColor(QColor('#121214'))
-                        self.effect.setBlurRadius(15)
-                        self.label_pushbutton.setGraphicsEffect(self.effect)
-                        self.task_widget.task_line_widget.setGraphicsEffect(self.effect)
-                    elif event.type() == QEvent.HoverLeave:
-                        self.label_pushbutton.setGraphicsEffect(None)
-                        self.task_widget.task_line_widget.setGraphicsEffect(None)
-
-                return super().eventFilter(obj, event)
-
-            def set_visibility(self):
-                self.setVisible(self.task_widget.isVisible())
-
-            def make_sub_timelines(self, **kwargs):
-                l = self.calendar_widget.timelines_layout
-                # Add new sub-timelines
-                for subtask in self.task.children:
-                    if subtask not in [widget.task for widget in self.sub_timelines]:
-                        subtask_widget = [w for w in self.task_widget.subtask_widgets
-                                          if w.task == subtask][0]
-                        sub_timeline = Timeline(task_widget=subtask_widget,
-                                                calendar_widget=self.calendar_widget,
-                                                parent=self.parent(),
-                                                style=self._style,
-                                                add_to_timelines_layout=True)
-                        # Add the sub-timeline to the main timelines layout
-                        # Find the correct position in the layout
-                        # where the sub-timeline is inserted
-                        l.removeWidget(sub_timeline)
-                        index = self.task.descendants.index(subtask)
-                        index += l.indexOf(self) + 1
-                        l.insertWidget(index, sub_timeline)
-                        # sub_timeline.setFixedHeight(self.height())
-                        self.sub_timelines += [sub_timeline]
-                # Remove non-existent sub-timelines
-                for widget in self.sub_timelines:
-                    if widget.task not in self.task.children:
-                        index = l.indexOf(widget)
-                        w = widget
-                        while w == widget or (w is not None and w.task in widget.task.descendants):
-                            w.hide()
-                            try:  # It may be that the widget had been removed from the list, but not hidden
-                                self.calendar_widget.timeline_widgets.remove(w)
-                            except:
-                                pass
-                            l.removeWidget(w)
-                            if l.count() > 0:
-                                try:
-                                    index += 1
-                                    w = l.itemAt(index).widget()
-                                except:
-                                    break
-                            else:
-                                break
-
-        def add_timeline(task_w):
-            if task not in [widget.task_widget.task for widget in self.timeline_widgets]:
-                task_widget = [w for w in self.task_list_widget.task_widgets
-                               if w.task == task][0]
-                widget = Timeline(task_widget=task_widget,
-                                  calendar_widget=self,
-                                  parent=self,
-                                  style=self._style,
-                                  add_to_timelines_layout=True)
-                self.timeline_widgets += [widget]
-                if task_widget.task.is_top_level:
-                    widget.show()
+                    self.calendar_widget.show()
+                    self.calendar_widget.blockSignals(True)
+                    current_date = getattr(self.calendar_timelines_widget, f'{self.time_mode}_date')
+                    self.calendar_widget.setSelectedDate(QDate(current_date.year,
+                                                               current_date.month,
+                                                               current_date.day))
+                    self.calendar_widget.blockSignals(False)
 
-        for task in self.planner.tasks:
-            add_timeline(task)
-
-        # Remove non-existent timelines and all of those related to descendant tasks
-        # This cannot be handled easily from within the nested structure of a Timeline object
-        # and removing its sub-timelines, because the information about "ancestor" timelines
-        # is absent in the current implementation. Only descendant timelines are available, hence,
-        # a top-down deletion.
-        for widget in self.timeline_widgets:
-            if widget.task not in self.planner.tasks:
-                index = self.timelines_layout.indexOf(widget)
-                w = widget
-                while w == widget or w.task in widget.task.descendants:
-                    w.hide()
-                    try:  # It may be that the widget had been removed from the list, but not hidden
-                        self.timeline_widgets.remove(w)
-                    except:
-                        pass
-                    self.timelines_layout.removeWidget(w)
-                    if self.timelines_layout.count() > 0:
-                        try:
-                            index += 1
-                            w = self.timelines_layout.itemAt(index).widget()
-                        except:
-                            break
+                self.pushbutton.clicked.connect(clicked)
+
+            def make_calendar_widget(self):
+                self.calendar_widget = QCalendarWidget()
+                self.calendar_widget.setGridVisible(True)
+                # Geometry
+                x, y, w, h = [getattr(self.parent().geometry(), f'{z}')() for z in ['x',
+                                                                                    'y',
+                                                                                    'width',
+                                                                                    'height']]
+                self.calendar_widget.setWindowTitle(f'{self.time_mode.title()} Date')
+                self.calendar_widget.setGeometry(int(x + 1.5 * w),
+                                                 int(y + h / 2),
+                                                 self.calendar_widget.width(),
+                                                 self.calendar_widget.height())
+
+                def callback():
+                    from datetime import date as dt
+                    # Get the extreme start and end dates among all tasks of the planner
+                    first_start_date, last_end_date = [], []
+                    for task in self.planner.tasks:
+                        first_start_date += [min([t.start_date for t in [task] + list(task.descendants)])]
+                        last_end_date += [max([t.end_date for t in [task] + list(task.descendants)])]
+                    if first_start_date:
+                        first_start_date = min(first_start_date)
                     else:
-                        break
-        self.timelines_updated.emit()
+                        first_start_date = dt.today()
+                    if last_end_date:
+                        last_end_date = max(last_end_date)
+                    else:
+                        last_end_date = first_start_date + relativedelta(months=6)
+                    # Get date from calendar
+                    date = self.calendar_widget.selectedDate()
+                    date = dt(year=date.year(), month=date.month(), day=1)
+                    if self.time_mode == 'start':
+                        if date > self.calendar_timelines_widget.end_date:
+                            warning(f'CalendarWidget: start date {date.strftime("%d/%m/%y")} '
+                                    f'is greater than end date '
+                                    f'{self.calendar_timelines_widget.end_date.strftime("%d/%m/%y")}')
+                            date = dt.today()
+                            date = dt(date.year, date.month, 1)
+                            self.calendar_timelines_widget.end_date = date + relativedelta(months=6)
+                    else:
+                        if date < self.calendar_timelines_widget.start_date:
+                            warning(f'CalendarWidget: end date {date.strftime("%d/%m/%y")} '
+                                    f'is smaller than end date '
+                                    f'{self.calendar_timelines_widget.start_date.strftime("%d/%m/%y")}')
+                            date = self.calendar_timelines_widget.start_date + relativedelta(months=6)
+                            date = dt(date.year, date.month, 1)
+
+                    if self.time_mode == 'start' and date <= first_start_date\
+                        or self.time_mode == 'end' and date >= last_end_date:
+                        # Set date to calendar
+                        setattr(self.calendar_timelines_widget, f'{self.time_mode}_date', date)
+
+                    self.update_label()
+                    # Hide calendar
+                    self.calendar_widget.hide()
+
+                self.calendar_widget.clicked.connect(callback)
+
+            # User interactions
+            def update_label(self):
+                # Get the extreme start and end dates among all tasks of the planner
+                from datetime import date as dt
+                first_start_date, last_end_date = [], []
+                for task in self.planner.tasks:
+                    first_start_date += [min([t.start_date for t in [task] + list(task.descendants)])]
+                    last_end_date += [max([t.end_date for t in [task] + list(task.descendants)])]
+                if first_start_date:
+                    first_start_date = min(first_start_date)
+                else:
+                    first_start_date = dt.today()
+                if last_end_date:
+                    last_end_date = max(last_end_date)
+                else:
+                    last_end_date = first_start_date + relativedelta(months=6)
+
+                date = first_start_date if self.time_mode == 'start' else last_end_date
+                date = dt(date.year, date.month, 1)
+                if date < self.calendar_timelines_widget.start_date \
+                    or date > self.calendar_timelines_widget.end_date:
+                    setattr(self.calendar_timelines_widget, f'{self.time_mode}_date', date)
+                else:
+                    date = getattr(self.calendar_timelines_widget, f'{self.time_mode}_date')
+                    date = dt(date.year, date.month, 1)
+                # Handle the definition of end date in the calendar widget, which includes the whole month
+                if self.time_mode == 'end':
+                    date += relativedelta(months=1)
+                self.pushbutton.setText(f'{date.day}/{date.month}/{date.year}')
+
+        self.new_task_settings_layout.addSpacing(int(self.width() * 0.1))
+        self.start_date_widget = DateWidget(planner=self.planner,
+                                            calendar_timelines_widget=self.calendar_widget,
+                                            parent=self,
+                                            time_mode='start',
+                                            style=self._style)
+        self.new_task_settings_layout.addWidget(self.start_date_widget)
+
+        self.new_task_settings_layout.addSpacing(int(self.width() * 0.1))
+
+        self.end_date_widget = DateWidget(planner=self.planner,
+                                            calendar_timelines_widget=self.calendar_widget,
+                                            parent=self,
+                                            time_mode='end',
+                                            style=self._style)
+        self.new_task_settings_layout.addWidget(self.end_date_widget)
+
+
+class ViewSelector(QFrame):
+    """
+    This widget contains:
+        - A label indicating that this is a view selector
+        - A combobox containing the view types
+    """
+
+    def __init__(self,
+                 calendar_widget: CalendarWidget,
+                 parent: QWidget = None,
+                 style: PlannerWidgetStyle = None):
+        self._style = style
+        self.calendar_widget = calendar_widget
+        super().__init__(parent=parent)
+        # Layout
+        self.layout = QVBoxLayout(self)
+        # Label
+        self.make_label()
+        # Combobox
+        self.make_combobox()
+        # Style
+        self.set_style()
+        self.layout.addStretch()
+
+    def set_style(self, style: PlannerWidgetStyle = None):
+        self._style = style if style is not None else self._style
+        if self._style is not None:
+            set_style(widget=self,
+                      stylesheets=self._style.stylesheets
+                      ['planner_tab']
+                      ['view_selector'])
+
+    def make_label(self):
+        self.label = QLabel('Planner View')
+        self.layout.addWidget(self.label)
+        self.label.setAlignment(Qt.AlignLeft)
+
+    def make_combobox(self):
+        self.combobox = QComboBox()
+        # Layout
+        self.layout.addWidget(self.combobox)
+        # Add items
+        self.combobox.addItems([view.title() for view in TIMELINE_VIEW_TYPES])
+
+        # User interactions
+        def clicked():
+            self.calendar_widget.view_type = self.combobox.currentText().lower()
+
+        def update(**kwargs):
+            self.combobox.blockSignals(True)
+            self.combobox.setCurrentText(self.calendar_widget.view_type.title())
+            self.combobox.blockSignals(False)
+
+        # Connect task and widget
+        self.combobox.currentIndexChanged.connect(clicked)
+        self.calendar_widget.view_type_changed.connect(update)
+        # Set initial value
+        update()
+
+
+class MonthWidget(QFrame):
+    """
+    This widget contains:
+        - A label containing the month
+        - A set of labels containing the weeks of the month
+    """
+
+    def __init__(self,
+                 task_list_widget: TaskListWidget,
+                 calendar_widget: CalendarWidget,
+                 date: date,
+                 parent: QWidget = None,
+                 style: PlannerWidgetStyle = None,
+                 fixed_width: int = None,
+                 weeks: list = None,
+                 lazy: bool = False):
+        """
+        :param task_list_widget: :py:class:'taskplanner.gui.planner.TaskListWidget'
+            Widget containing the task list connected to the calendar widget
+        :param calendar_widget: :py:class:'taskplanner.gui.planner.CalendarWidget'
+            The calendar widget containing this widget
+        :param date: :py:class:'datetime.date'
+            The first day of the month
+        :param parent: :py:class:'QWidget', optional
+            The parent widget
+        :param style: :py:class:'taskplanner.gui.styles.PlannerWidgetStyle', optional
+            The style of this widget.
+        :param fixed_width: int, optional
+            The width of the widget in 'monthly' view. By default, it is a fixed fraction of the screen width.
+        :param weeks: tuple of (week_date, (day_dates)), optional
+            The weeks of the month, as computed by :py:func:'_build_month_model'.
+            By default, they are computed from the date.
+        :param lazy: bool, optional
+            If True, the week widgets are only built when this widget is first painted,
+            i.e., when it is scrolled into view.
+        """
+        self.task_list_widget = task_list_widget
+        self.calendar_widget = calendar_widget
+        self._style = style
+        self.date = date
+        self.fixed_width = fixed_width if fixed_width is not None else int(SCREEN_WIDTH * 0.13)
+        self.weeks = weeks if weeks is not None else _month_weeks(date.year, date.month)
+        self.dates = [week_date for week_date, _ in self.weeks]
+        self.week_widgets = []
+        self._week_widgets_pending = False
+        self.view_type = None
+        super().__init__(parent=parent)
+        # Layout
+        self.layout = QVBoxLayout(self)
+        self.layout.setAlignment(Qt.AlignCenter)
+        self._default_margins = self.layout.contentsMargins()
+        self.setFixedHeight(int(SCREEN_HEIGHT * 0.1))
+        # Month label
+        self.make_label()
+        # Horizontal layout for week widgets
+        self.week_widgets_layout = QHBoxLayout()
+        self.week_widgets_layout.setAlignment(Qt.AlignLeft)
+        self.layout.addLayout(self.week_widgets_layout)
+        # Stretch between the label and the week widgets, only expanding in 'weekly' and 'daily' view
+        self.week_widgets_stretch = QSpacerItem(0, 0, QSizePolicy.Minimum, QSizePolicy.Fixed)
+        self.layout.insertItem(1, self.week_widgets_stretch)
+
+        # Week widgets
+        '''
+        if calendar_widget.view_type in ['weekly',
+                                         'daily']:
+            if self._style is not None:
+                stylesheet = self._style.stylesheets['planner_tab']['calendar_widget']['month_widget']
+                stylesheet['main'] = stylesheet['main'].replace('border:0.5px', 'border:0px')
+                stylesheet['label'] = stylesheet['label'].replace(
+                    'background-color:None',
+                    f'background-color:{self._style.color_palette["background 2"]}')
+                self._style.stylesheets['planner_tab']['calendar_widget']['month_widget'] = stylesheet
+                set_style(widget=self,
+                          stylesheets=self._style.stylesheets
+                          ['planner_tab']
+                          ['calendar_widget']
+                          ['month_widget'])
+                self.layout.setAlignment(Qt.AlignLeft)
+            self.layout.setContentsMargins(0, 0, 0, 0)
+            self.week_widgets_layout.setSpacing(0)
+            self.make_week_widgets()
+            self.layout.insertStretch(1)
+        else:
+            if self._style is not None:
+                stylesheet = self._style.stylesheets['planner_tab']['calendar_widget']['month_widget']
+                stylesheet['main'] = stylesheet['main'].replace('border:0px', 'border:0.5px')
+                stylesheet['label'] = stylesheet['label'].replace(f'background-color:{self._style.color_palette["background 2"]}',
+                                                                  'background-color:None')
+                self._style.stylesheets['planner_tab']['calendar_widget']['month_widget'] = stylesheet
+                set_style(widget=self,
+                          stylesheets=self._style.stylesheets
+                          ['planner_tab']
+                          ['calendar_widget']
+                          ['month_widget'])
+                self.layout.setAlignment(Qt.AlignCenter)
+            self.setFixedWidth(int(SCREEN_WIDTH*0.13))
+        # Set style
+        if self._style is not None:
+            set_style(widget=self,
+                      stylesheets=self._style.stylesheets
+                      ['planner_tab']
+                      ['calendar_widget']
+                      ['month_widget'])
+        '''
+        self.set_view_type(lazy=lazy)
+        # Style (the week widgets have already styled themselves)
+        self.set_style(update_children=False)
+
+    def set_view_type(self,
+                      fixed_width: int = None,
+                      lazy: bool = False):
+        """
+        Lays this widget out for the view type of the calendar widget. The week widgets that
+        were already built are shown or hidden, rather than rebuilt.
+        :param fixed_width: int, optional
+            The width of the widget in 'monthly' view. By default, the current one.
+        :param lazy: bool, optional
+            If True and the week widgets have not been built yet, they are only built when
+            this widget is first painted.
+        """
+        self.view_type = self.calendar_widget.view_type
+        self.fixed_width = fixed_width if fixed_width is not None else self.fixed_width
+        if self.view_type in ['weekly',
+                              'daily']:
+            self.layout.setContentsMargins(0, 0, 0, 0)
+            self.week_widgets_layout.setSpacing(0)
+            self.label.setContentsMargins(10, 0, 0, 0)
+            self.week_widgets_stretch.changeSize(0, 0, QSizePolicy.Minimum, QSizePolicy.Expanding)
+            self.setMinimumWidth(0)
+            self.setMaximumWidth(QWIDGETSIZE_MAX)
+            if self.week_widgets:
+                for widget in self.week_widgets:
+                    widget.set_view_type()
+                    widget.show()
+            elif lazy:
+                # Reserve the space of the week widgets until they are built
+                if self.view_type == 'weekly':
+                    self.setMinimumWidth(len(self.weeks) * int(SCREEN_WIDTH * 0.05))
+                else:
+                    self.setMinimumWidth(sum(len(day_dates) for _, day_dates in self.weeks)
+                                         * int(SCREEN_WIDTH * 0.04))
+                self._week_widgets_pending = True
+            else:
+                self._week_widgets_pending = False
+                self.make_week_widgets()
+        else:
+            # The week widgets are not displayed in 'monthly' view
+            self._week_widgets_pending = False
+            self.layout.setContentsMargins(self._default_margins)
+            self.label.setContentsMargins(0, 0, 0, 0)
+            self.week_widgets_stretch.changeSize(0, 0, QSizePolicy.Minimum, QSizePolicy.Fixed)
+            for widget in self.week_widgets:
+                widget.hide()
+            self.setFixedWidth(self.fixed_width)
+        self.layout.invalidate()
+
+    def set_style(self, style: PlannerWidgetStyle = None, update_children: bool = True):
+        self._style = style if style is not None else self._style
+        if self._style is not None:
+            stylesheet = self._style.stylesheets['planner_tab']['calendar_widget']['month_widget']
+            if self.calendar_widget.view_type in ['weekly',
+                                                  'daily']:
+                stylesheet['main'] = stylesheet['main'].replace('border:0.5px', 'border:0px')
+                stylesheet['label'] = stylesheet['label'].replace(
+                    'background-color:None',
+                    f'background-color:{self._style.color_palette["background 2"]}')
+                self.layout.setAlignment(Qt.AlignLeft)
+            else:
+                if (self.date.year, self.date.month) == (date.today().year, date.today().month): # Highlight today's month
+                    color_old = 'None',
+                    color_new = self._style.color_palette['background 2']
+                    stylesheet['main'] = stylesheet['main'].replace(
+                        f'background-color:{color_old}',
+                        f'background-color:{color_new}')
+                stylesheet['label'] = stylesheet['label'].replace(
+                    f'background-color:{self._style.color_palette["background 2"]}',
+                    f'background-color:None')
+                stylesheet['main'] = stylesheet['main'].replace('border:0px', 'border:0.5px')
+                self.layout.setAlignment(Qt.AlignCenter)
+            set_style(widget=self,
+                      stylesheets=stylesheet)
+            if update_children:
+                for widget in self.week_widgets:
+                    widget.set_style(self._style)
+
+    def make_label(self):
+        self.label = QLabel()
+        # Layout
+        self.layout.addWidget(self.label)
+        self.label.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
+        # Set text
+        self.label.setText(_format_date(self.date.toordinal(), MONTH_LABEL_FORMAT))
+
+    def paintEvent(self, a0):
+        super().paintEvent(a0)
+        if self._week_widgets_pending:
+            # Build the week widgets outside of the paint event
+            QTimer.singleShot(0, self.ensure_week_widgets)
+
+    def ensure_week_widgets(self):
+        """
+        Builds the week widgets, if they were deferred.
+        """
+        if self._week_widgets_pending:
+            self._week_widgets_pending = False
+            self.make_week_widgets()
+
+    def make_week_widgets(self):
+        # Deferred week widgets are built while this widget is displayed, so it is repainted once at the end
+        self.setUpdatesEnabled(False)
+        try:
+            self.week_widgets = []
+            for week_date, day_dates in self.weeks:
+                self.week_widgets.append(WeekWidget(task_list_widget=self.task_list_widget,
+                                                    calendar_widget=self.calendar_widget,
+                                                    date=week_date,
+                                                    parent=self,
+                                                    style=self._style,
+                                                    day_dates=day_dates))
+                self.week_widgets_layout.addWidget(self.week_widgets[-1])
+            self.setMinimumWidth(0)
+        finally:
+            self.setUpdatesEnabled(True)
+
+
+class WeekWidget(QFrame):
+    """
+    This widget contains:
+        - A label containing the week
+        - A set of labels containing the days of the week
+    """
+
+    def __init__(self,
+                 task_list_widget: TaskListWidget,
+                 calendar_widget: CalendarWidget,
+                 date: date,
+                 parent: QWidget = None,
+                 style: PlannerWidgetStyle = None,
+                 day_dates: list = None):
+        self.task_list_widget = task_list_widget
+        self.calendar_widget = calendar_widget
+        self._style = style
+        self.date = date
+        # Days of the week within the month, as computed by _build_month_model
+        self.day_dates = day_dates if day_dates is not None else _week_days(date)
+        self.dates = []
+        self.day_widgets = []
+        super().__init__(parent=parent)
+        # Layout
+        self.layout = QVBoxLayout(self)
+        self.layout.setAlignment(Qt.AlignTop)
+        self._default_margins = self.layout.contentsMargins()
+        # Week label
+        self.make_label()
+        # Horizontal layout for week widgets
+        self.day_widgets_layout = QHBoxLayout()
+        self.day_widgets_layout.setAlignment(Qt.AlignLeft)
+        self.layout.addLayout(self.day_widgets_layout)
+        # Day widgets
+        self.set_view_type()
+        # Style (the day widgets have already styled themselves)
+        self.set_style(update_children=False)
+
+    def set_view_type(self):
+        """
+        Lays this widget out for the view type of the calendar widget. The day widgets that
+        were already built are shown or hidden, rather than rebuilt.
+        """
+        if self.calendar_widget.view_type == 'daily':
+            self.layout.setContentsMargins(0, 0, 0, 0)
+            self.day_widgets_layout.setSpacing(0)
+            self.label.setContentsMargins(10, 0, 0, 0)
+            self.setMinimumWidth(0)
+            self.setMaximumWidth(QWIDGETSIZE_MAX)
+            if self.day_widgets:
+                for widget in self.day_widgets:
+                    widget.show()
+            else:
+                self.make_day_widgets()
+        else:
+            # The day widgets are not displayed in 'weekly' view
+            self.layout.setContentsMargins(self._default_margins)
+            self.label.setContentsMargins(0, 0, 0, 0)
+            for widget in self.day_widgets:
+                widget.hide()
+            self.setFixedWidth(int(SCREEN_WIDTH * 0.05))
+
+    def set_style(self, style: PlannerWidgetStyle = None, update_children: bool = True):
+        self._style = style if style is not None else self._style
+        if self._style is not None:
+            stylesheet = self._style.stylesheets['planner_tab']['calendar_widget']['week_widget']
+            if self.calendar_widget.view_type == 'daily':
+                stylesheet['main'] = stylesheet['main'].replace('border:0.5px', 'border:0px')
+                self.layout.setAlignment(Qt.AlignLeft)
+            else:
+                today = date.today()
+                this_sunday = today + timedelta(days=7 - today.weekday())
+                if today <= self.date <= this_sunday:  # Highlight today's week
+                    color_old = 'None',
+                    color_new = self._style.color_palette['background 2']
+                else:
+                    color_new = 'None',
+                    color_old = self._style.color_palette['background 2']
+                stylesheet['main'] = stylesheet['main'].replace(
+                    f'background-color:{color_old}',
+                    f'background-color:{color_new}')
+                stylesheet['label'] = stylesheet['label'].replace(
+                    f'background-color:{self._style.color_palette["background 2"]}',
+                    f'background-color:None')
+                stylesheet['main'] = stylesheet['main'].replace('border:0px', 'border:0.5px')
+                self.layout.setAlignment(Qt.AlignCenter)
+            if self.calendar_widget.view_type == 'daily':
+                # The day widgets share the style sheet of this widget
+                day_stylesheet = self._style.stylesheets['planner_tab']['calendar_widget']['day_widget']['main']
+                stylesheet = dict(stylesheet,
+                                  main=stylesheet['main'] + _day_widgets_stylesheet(day_stylesheet))
+
+            set_style(widget=self,
+                      stylesheets=stylesheet)
+            if update_children:
+                for widget in self.day_widgets:
+                    widget.set_style(self._style)
+
+    def make_label(self):
+        self.label = QLabel()
+        # Layout
+        self.layout.addWidget(self.label)
+        self.label.setAlignment(Qt.AlignVCenter)
+        # Set text
+        self.label.setText(_format_date(self.date.toordinal(), WEEK_LABEL_FORMAT))
+
+    def make_day_widgets(self):
+        self.dates = list(self.day_dates)
+        self.n_days = len(self.dates)
+        self.setUpdatesEnabled(False)
+        try:
+            self.day_widgets = []
+            for day_date in self.dates:
+                self.day_widgets.append(DayWidget(task_list_widget=self.task_list_widget,
+                                                  date=day_date,
+                                                  parent=self,
+                                                  style=self._style))
+                self.day_widgets_layout.addWidget(self.day_widgets[-1])
+        finally:
+            self.setUpdatesEnabled(True)
+
+
+class DayWidget(QLabel):
+    """
+    This widget is a label containing the day.
+    It has no inner layout, since there are many day widgets in 'daily' view.
+    """
+
+    def __init__(self,
+                 task_list_widget: TaskListWidget,
+                 date: date,
+                 parent: QWidget = None,
+                 style: PlannerWidgetStyle = None):
+        self.task_list_widget = task_list_widget
+        self._style = style
+        self.date = date
+        super().__init__(parent=parent)
+        self.setObjectName(DAY_WIDGET_OBJECT_NAME)
+        self.setFixedWidth(int(SCREEN_WIDTH*0.04))
+        # Day label
+        self.make_label()
+        # Set style
+        self.set_style()
+
+    def set_style(self, style: PlannerWidgetStyle = None):
+        self._style = style if style is not None else self._style
+        if self._style is not None:
+            if self.date == date.today():  # Highlight today
+                stylesheet = self._style.stylesheets['planner_tab']['calendar_widget']['day_widget']
+                color_old = 'None',
+                color_new = self._style.color_palette['background 2']
+                stylesheet['main'] = stylesheet['main'].replace(
+                    f'background-color:{color_old}',
+                    f'background-color:{color_new}')
+                set_style(widget=self,
+                          stylesheets=stylesheet)
+            else:
+                # The other days are styled by the style sheet of their week widget
+                set_style_sheet(self, '')
+
+
+    def make_label(self):
+        self.setAlignment(Qt.AlignCenter)
+        # Set text
+        self.setText(f'{_format_date(self.date.toordinal(), DAY_LABEL_FORMAT)[:3]} {self.date.day}')
 
 
 class TaskBucketWidget(QFrame):
@@ -2656,165 +3171,6 @@ class TaskBucketWidget(QFrame):
         self.label.setText(text)
 
     def make_task_list(self):
-        class BucketTaskListWidget(QFrame):
-            """
-            This widget contains a list of widgets sharing the bucket's property
-            """
-            def __init__(self,
-                         property_name: str,
-                         property_value: str,
-                         planner: Planner,
-                         parent: QWidget = None,
-                         style: PlannerWidgetStyle = DEFAULT_PLANNER_STYLE
-                         ):
-                """
-
-                :param property_name:
-                :param property_value:
-                :param planner:
-                :param parent:
-                :param style:
-                """
-                if not hasattr(Task(), property_name) and property_name != 'due date':
-                    raise ValueError(f'Tasks have no such property as "{property_name}"')
-                self.property_name = property_name
-                self.property_value = property_value
-                self.planner = planner
-                self._style = style
-                self.task_widgets = []
-                self.tasks = []
-                self.tasks_updated = Signal()
-                super().__init__(parent=parent)
-                # Layout
-                self.layout = QVBoxLayout(self)
-                self.layout.setAlignment(Qt.AlignTop)
-                self.layout.setContentsMargins(0, 0, 0, 0)
-                self.layout.setSpacing(20)
-                # Task widgets
-                self.planner.tasks_changed.connect(self.make_task_widgets)
-                self.make_task_widgets()
-                self.destroyed.connect(self.disconnect_tasks)
-                # Style
-                self.set_style()
-
-            def set_style(self, style: PlannerWidgetStyle = None):
-                self._style = style if style is not None else self._style
-                if self._style is not None:
-                    set_style(widget=self,
-                              stylesheets=self._style.stylesheets
-                              ['task_buckets_tab']
-                              ['bucket_list_widget']
-                              ['bucket_widget']
-                              ['task_list_widget']['main'])
-                    set_style(widget=self,
-                              stylesheets=self._style.stylesheets
-                              ['task_buckets_tab']
-                              ['bucket_list_widget']
-                              ['bucket_widget']
-                              ['task_list_scrollarea']['main'])
-                    for widget in self.task_widgets:
-                        widget.set_style(TaskWidgetStyle(color_palette=self._style.color_palette,
-                                                         font=self._style.font,
-                                                         style_name=self._style.style_name))
-
-            def make_task_widgets(self, **kwargs):
-                all_tasks = self.planner.all_tasks
-
-                for task in all_tasks:
-                    to_be_added = task not in self.tasks
-                    if self.property_name != 'due date':
-                        to_be_added = to_be_added and getattr(task, self.property_name) == self.property_value
-                    else:
-                        to_be_added = to_be_added and task.progress != 'completed'
-                        if self.property_value == 'overdue':
-                            to_be_added = to_be_added and (task.end_date < date.today())
-
-                        elif self.property_value == 'due today':
-                            to_be_added = to_be_added and (task.end_date == date.today())
-
-                        elif self.property_value == 'due this week':
-                            today = date.today()
-                            this_sunday = today + relativedelta(days=7 - today.weekday())
-                            to_be_added = to_be_added and (today < task.end_date <= this_sunday)
-
-                    if to_be_added:
-                        # Create task widget
-                        widget = TaskWidgetSimple(parent=self,
-                                                  task=task,
-                                                  planner=self.planner,
-                                                  style=TaskWidgetStyle(color_palette=self._style.color_palette,
-                                                                        font=self._style.font,
-                                                                        style_name=self._style.style_name),
-                                                  widget_spacing=15
-                                                  )
-                        widget.setContentsMargins(10,
-                                                  0,
-                                                  int(SCREEN_WIDTH * 0.003),
-                                                  0)
-                        widget.layout.setContentsMargins(10,
-                                                         0,
-                                                         int(SCREEN_WIDTH * 0.003),
-                                                         0)
-                        # Add task widget to layout
-                        self.layout.addWidget(widget)
-                        self.task_widgets += [widget]
-                        # Add new task
-                        self.tasks += [task]
-                        # Connect task and task list update
-                        if self.property_name != 'due date':
-                            getattr(task, f'{self.property_name}_changed') \
-                                .connect(self.make_task_widgets)
-                        else:
-                            for task in self.tasks:
-                                getattr(task, f'progress_changed').connect(self.make_task_widgets)
-                                getattr(task, f'end_date_changed').connect(self.make_task_widgets)
-                # Remove non-existent tasks
-                for widget in self.task_widgets:
-                    to_be_removed = widget.task not in self.planner.all_tasks
-                    if self.property_name != 'due date':
-                        to_be_removed = to_be_removed or getattr(widget.task, self.property_name) != self.property_value
-                    else:
-                        to_be_removed = to_be_removed or task.progress == 'completed'
-                        if self.property_value == 'overdue':
-                            to_be_removed = to_be_removed or not (task.end_date < date.today())
-
-                        elif self.property_value == 'due today':
-                            to_be_removed = to_be_removed or not (task.end_date == date.today())
-
-                        elif self.property_value == 'due this week':
-                            today = date.today()
-                            this_sunday = today + relativedelta(days=7-today.weekday())
-                            to_be_removed = to_be_removed or not (today < task.end_date <= this_sunday)
-
-
-                    if to_be_removed:
-                        if widget.task in self.tasks:
-                            self.tasks.remove(widget.task)
-                        if self.property_name != 'due date':
-                            getattr(widget.task, f'{self.property_name}_changed').disconnect(self.make_task_widgets)
-                        else:
-                            for task in self.tasks:
-                                getattr(task, f'progress_changed').disconnect(self.make_task_widgets)
-                                getattr(task, f'end_date_changed').disconnect(self.make_task_widgets)
-                        widget.hide()
-                        self.task_widgets.remove(widget)
-                        self.layout.removeWidget(widget)
-                        if not self.tasks and self.property_name not in ['priority', 'progress', 'due date']:
-                            self.hide()
-
-                self.tasks_updated.emit()
-
-
-            def disconnect_tasks(self):
-                if self.property_name != 'due date':
-                    for task in self.tasks:
-                        getattr(task, f'{self.property_name}_changed').disconnect(self.make_task_widgets)
-                else:
-                    for task in self.tasks:
-                        getattr(task, f'progress_changed').disconnect(self.make_task_widgets)
-                        getattr(task, f'end_date_changed').disconnect(self.make_task_widgets)
-                self.planner.tasks_changed.disconnect(self.make_task_widgets)
-
         self.task_list_widget = BucketTaskListWidget(property_name=self.property_name,
                                                      property_value=self.property_value,
                                                      planner=self.planner,
@@ -2822,6 +3178,156 @@ class TaskBucketWidget(QFrame):
                                                      style=self._style)
 
 
+class BucketTaskListWidget(QFrame):
+    """
+    This widget contains a list of widgets sharing the bucket's property
+    """
+    def __init__(self,
+                 property_name: str,
+                 property_value: str,
+                 planner: Planner,
+                 parent: QWidget = None,
+                 style: PlannerWidgetStyle = DEFAULT_PLANNER_STYLE
+                 ):
+        """
+
+        :param property_name:
+        :param property_value:
+        :param planner:
+        :param parent:
+        :param style:
+        """
+        if not hasattr(Task(), property_name) and property_name != 'due date':
+            raise ValueError(f'Tasks have no such property as "{property_name}"')
+        self.property_name = property_name
+        self.property_value = property_value
+        self.planner = planner
+        self._style = style
+        # Style shared by all task widgets
+        self._task_widget_style = _task_widget_style(self._style)
+        self.task_widgets = []
+        self.tasks = []
+        self.tasks_updated = Signal()
+        super().__init__(parent=parent)
+        # Layout
+        self.layout = QVBoxLayout(self)
+        self.layout.setAlignment(Qt.AlignTop)
+        self.layout.setContentsMargins(0, 0, 0, 0)
+        self.layout.setSpacing(20)
+        # Task widgets. They are updated by the bucket list widget, once per burst of task changes
+        self.make_task_widgets()
+        self.destroyed.connect(self.disconnect_tasks)
+        # Style
+        self.set_style()
+
+    def set_style(self, style: PlannerWidgetStyle = None):
+        self._style = style if style is not None else self._style
+        if self._style is not None:
+            set_style(widget=self,
+                      stylesheets=self._style.stylesheets
+                      ['task_buckets_tab']
+                      ['bucket_list_widget']
+                      ['bucket_widget']
+                      ['task_list_widget']['main'])
+            set_style(widget=self,
+                      stylesheets=self._style.stylesheets
+                      ['task_buckets_tab']
+                      ['bucket_list_widget']
+                      ['bucket_widget']
+                      ['task_list_scrollarea']['main'])
+            task_widget_style = _task_widget_style(self._style)
+            # The task widgets were built with the same style
+            if task_widget_style is not self._task_widget_style:
+                self._task_widget_style = task_widget_style
+                for widget in self.task_widgets:
+                    widget.set_style(self._task_widget_style)
+
+    def make_task_widgets(self, all_tasks: list = None, **kwargs):
+        # Materialize the planner's tasks once: all_tasks walks all task trees
+        if all_tasks is None:
+            all_tasks = self.planner.all_tasks
+        all_task_ids = {id(task) for task in all_tasks}
+        bucket_task_ids = {id(task) for task in self.tasks}
+        self.setUpdatesEnabled(False)
+
+        for task in all_tasks:
+            to_be_added = id(task) not in bucket_task_ids
+            if self.property_name != 'due date':
+                to_be_added = to_be_added and getattr(task, self.property_name) == self.property_value
+            else:
+                to_be_added = to_be_added and task.progress != 'completed'
+                if self.property_value == 'overdue':
+                    to_be_added = to_be_added and (task.end_date < date.today())
+
+                elif self.property_value == 'due today':
+                    to_be_added = to_be_added and (task.end_date == date.today())
+
+                elif self.property_value == 'due this week':
+                    today = date.today()
+                    this_sunday = today + timedelta(days=7 - today.weekday())
+                    to_be_added = to_be_added and (today < task.end_date <= this_sunday)
+
+            if to_be_added:
+                # Create task widget
+                widget = TaskWidgetSimple(parent=self,
+                                          task=task,
+                                          planner=self.planner,
+                                          style=self._task_widget_style,
+                                          widget_spacing=15
+                                          )
+                widget.setContentsMargins(10,
+                                          0,
+                                          int(SCREEN_WIDTH * 0.003),
+                                          0)
+                widget.layout.setContentsMargins(10,
+                                                 0,
+                                                 int(SCREEN_WIDTH * 0.003),
+                                                 0)
+                # Add task widget to layout
+                self.layout.addWidget(widget)
+                self.task_widgets.append(widget)
+                # Add new task
+                self.tasks += [task]
+                bucket_task_ids.add(id(task))
+        # Remove non-existent tasks
+        for widget in list(self.task_widgets):
+            to_be_removed = id(widget.task) not in all_task_ids
+            if self.property_name != 'due date':
+                to_be_removed = to_be_removed or getattr(widget.task, self.property_name) != self.property_value
+            else:
+                to_be_removed = to_be_removed or widget.task.progress == 'completed'
+                if self.property_value == 'overdue':
+                    to_be_removed = to_be_removed or not (widget.task.end_date < date.today())
+
+                elif self.property_value == 'due today':
+                    to_be_removed = to_be_removed or not (widget.task.end_date == date.today())
+
+                elif self.property_value == 'due this week':
+                    today = date.today()
+                    this_sunday = today + timedelta(days=7-today.weekday())
+                    to_be_removed = to_be_removed or not (today < widget.task.end_date <= this_sunday)
+
+
+            if to_be_removed:
+                if widget.task in self.tasks:
+                    self.tasks.remove(widget.task)
+                self.task_widgets.remove(widget)
+                self.layout.removeWidget(widget)
+                widget.disconnect_task()
+                widget.setParent(None)
+                widget.deleteLater()
+                if not self.tasks and self.property_name not in ['priority', 'progress', 'due date']:
+                    self.hide()
+        self.setUpdatesEnabled(True)
+
+        self.tasks_updated.emit()
+
+
+    def disconnect_tasks(self):
+        for widget in self.task_widgets:
+            widget.disconnect_task()
+
+
 class BucketListWidget(QFrame):
     """
     This widget contains a list of TaskBucketWidget. Each task bucket is labeled
@@ -2844,6 +3350,11 @@ class BucketListWidget(QFrame):
         self.layout = QHBoxLayout(self)
         self.layout.setAlignment(Qt.AlignLeft)
         self.layout.setContentsMargins(0, 0, 0, 0)
+        # Coalesce task changes into a single update of the buckets
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(0)
+        self._update_timer.timeout.connect(self.make_bucket_widgets)
         # Set property name and automatically make the task buckets
         self.property_name = property_name
         # Style
@@ -2877,29 +3388,46 @@ class BucketListWidget(QFrame):
         self.property_name_changed.emit()
 
     def disconnect_buckets(self):
-        for widget in self.bucket_widgets:
-            widget.hide()
-            widget.task_list_widget.disconnect_tasks()
-        self.bucket_widgets = []
+        for widget in list(self.bucket_widgets):
+            self.remove_bucket_widget(widget)
 
-    def make_task_connections(self):
-        self.planner.tasks_changed.disconnect(self.make_bucket_widgets)
-        self.planner.tasks_changed.connect(self.make_bucket_widgets)
-        all_tasks = self.planner.all_tasks
+    def remove_bucket_widget(self, widget: TaskBucketWidget):
+        """
+        Disconnects a bucket widget and its task widgets from their tasks, and deletes it.
+
+        :param widget: :py:class:'TaskBucketWidget'
+            The bucket widget to be removed
+        """
+        self.bucket_widgets.remove(widget)
+        widget.task_list_widget.disconnect_tasks()
+        self.layout.removeWidget(widget)
+        widget.setParent(None)
+        widget.deleteLater()
+
+    def make_task_connections(self, all_tasks: list = None):
+        self.planner.tasks_changed.disconnect(self.update_bucket_widgets)
+        self.planner.tasks_changed.connect(self.update_bucket_widgets)
+        if all_tasks is None:
+            all_tasks = self.planner.all_tasks
         for task in all_tasks:
             # Connect task and task list update
             if self.property_name != 'due date':
-                getattr(task, f'{self.property_name}_changed').disconnect(self.make_bucket_widgets)
+                getattr(task, f'{self.property_name}_changed').disconnect(self.update_bucket_widgets)
                 getattr(task, f'{self.property_name}_changed') \
-                    .connect(self.make_bucket_widgets)
+                    .connect(self.update_bucket_widgets)
             else:
-                getattr(task, f'progress_changed').connect(self.make_bucket_widgets)
-                getattr(task, f'end_date_changed').connect(self.make_bucket_widgets)
+                getattr(task, f'progress_changed').connect(self.update_bucket_widgets)
+                getattr(task, f'end_date_changed').connect(self.update_bucket_widgets)
             # Connect with subtask changes
-            task.children_changed.disconnect(self.make_bucket_widgets)
-            task.children_changed.connect(self.make_bucket_widgets)
+            task.children_changed.disconnect(self.update_bucket_widgets)
+            task.children_changed.connect(self.update_bucket_widgets)
+
+    def update_bucket_widgets(self, **kwargs):
+        # The buckets are updated once the current burst of changes is over
+        self._update_timer.start()
 
     def make_bucket_widgets(self, **kwargs):
+        # Walk the task trees once and share the result with the buckets
         all_tasks = self.planner.all_tasks
         # Identify the property values
         property_values = []
@@ -2917,7 +3445,6 @@ class BucketListWidget(QFrame):
                 property_values.sort()
         elif self.property_name in ['priority',
                                     'progress']:
-            from taskplanner.tasks import PRIORITY_LEVELS, PROGRESS_LEVELS
             dictionary = PRIORITY_LEVELS if self.property_name == 'priority' else PROGRESS_LEVELS
             property_values = list(dictionary.keys())
             property_values.sort(key=lambda x: dictionary[x])
@@ -2925,8 +3452,10 @@ class BucketListWidget(QFrame):
             property_values = ['due today', 'due this week', 'overdue']
 
         # Add buckets
+        self.setUpdatesEnabled(False)
+        bucket_widgets = {w.property_value: w for w in self.bucket_widgets}
         for value in property_values:
-            if value not in [w.property_value for w in self.bucket_widgets]:
+            if value not in bucket_widgets:
                 widget = TaskBucketWidget(property_name=self.property_name,
                                           property_value=value,
                                           planner=self.planner,
@@ -2936,23 +3465,19 @@ class BucketListWidget(QFrame):
                 self.layout.addWidget(widget)
                 self.bucket_widgets += [widget]
             else:
-                widget = [w for w in self.bucket_widgets
-                          if w.property_value == value][0]
-                widget.task_list_widget.make_task_widgets()
+                bucket_widgets[value].task_list_widget.make_task_widgets(all_tasks=all_tasks)
 
-        # Remove buckets associated to non-existent values
-        for widget in self.bucket_widgets:
+        # Remove buckets associated to non-existent values. Iterate over a copy, since buckets are removed
+        for widget in list(self.bucket_widgets):
             if widget.property_name not in ['priority', 'progress', 'due date']:
                 if widget.property_name != self.property_name \
                         or widget.property_value not in property_values or not widget.task_list_widget.tasks:
-                    widget.task_list_widget.disconnect_tasks()
-                    widget.hide()
-                    # self.layout.removeWidget(widget)
-                    self.bucket_widgets.remove(widget)
+                    self.remove_bucket_widget(widget)
+        self.setUpdatesEnabled(True)
 
         self.buckets_updated.emit()
 
-        self.make_task_connections()
+        self.make_task_connections(all_tasks=all_tasks)
 
 
 
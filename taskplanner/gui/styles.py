@@ -979,21 +979,16 @@ class PlannerWidgetStyle:
                                     {
                                         'main':
                                             '''
-                                            QWidget
+                                            QLabel
                                             {
                                                 background-color:None;
                                                 border:0.5px solid %s;
-                                            }
-                                            ''' % (self.color_palette['border']),
-                                        'label':
-                                            '''
-                                            QLabel
-                                            {   
-                                                border:None;
+                                                border-radius:10px;
+                                                padding:9px 0px;
                                                 color:%s;
                                                 font-size:%s;
                                             }
-                                            ''' % (
+                                            ''' % (self.color_palette['border'],
                                                    self.color_palette['text - light'],
                                                    self.font['size - text - small']),
                                     },
@@ -8,8 +8,8 @@ import markdown
 
 # %% Imports
 from PyQt5.Qt import QDesktopServices, QUrl, QApplication, QColor, Qt
-from PyQt5.QtCore import Qt, QDate, QEvent
-from PyQt5.QtGui import QIcon, QTextDocument, QTextCursor, QTextCharFormat
+from PyQt5.QtCore import Qt, QDate, QEvent, QTimer, QSignalBlocker
+from PyQt5.QtGui import QTextDocument, QTextCursor, QTextCharFormat
 from PyQt5.QtWidgets import \
     (
     QHBoxLayout,
@@ -28,8 +28,9 @@ from PyQt5.QtWidgets import \
     QGridLayout
     )
 from signalslot import Signal
+from weakref import WeakValueDictionary
 from taskplanner.gui.styles import TaskWidgetStyle, ICON_SIZES
-from taskplanner.gui.utilities import set_style, get_primary_screen
+from taskplanner.gui.utilities import set_style, get_primary_screen, get_icon
 from taskplanner.tasks import Task, PROGRESS_LEVELS, PRIORITY_LEVELS
 from taskplanner.planner import Planner
 from taskplanner.gui.utilities import select_directory, select_file
@@ -37,9 +38,33 @@ from taskplanner.gui.utilities import select_directory, select_file
 SCREEN = get_primary_screen()
 SCREEN_WIDTH = SCREEN.width
 SCREEN_HEIGHT = SCREEN.height
+# Time (ms) without keystrokes after which the text typed in a task's name or description is set to the task
+TEXT_EDIT_DEBOUNCE_INTERVAL = 50
 
 # Signals
 task_widget_widget_open = Signal()
+# Emitted before the planner is saved, so that the task widgets set the text typed since the last pause
+task_widget_flush_edits = Signal()
+# Path widget connected to each task's parent_changed signal, by task id
+_path_widgets = WeakValueDictionary()
+
+
+def diff_task_widgets(tasks, widgets):
+    """
+    Compares a sequence of tasks with the widgets that represent them.
+    :param tasks: iterable of :py:class:'taskplanner.tasks.Task'
+        The tasks that should be represented
+    :param widgets: iterable of widgets with a 'task' attribute
+        The existing widgets
+    :return: (list, list)
+        The tasks without a widget, in the order of 'tasks', and the widgets whose task is not in 'tasks'
+    """
+    current = {id(task): task for task in tasks}
+    existing = {id(widget.task): widget for widget in widgets}
+    missing = [task for task_id, task in current.items() if task_id not in existing]
+    stale = [widget for task_id, widget in existing.items() if task_id not in current]
+    return missing, stale
+
 
 class TaskWidget(QWidget):
     """
@@ -166,6 +191,7 @@ class TaskWidget(QWidget):
                       stylesheets=self._style.stylesheets['standard view'])
         task_widget_widget_open.emit()
         task_widget_widget_open.connect(self.hide)
+        task_widget_flush_edits.connect(self.flush_edits)
 
     def show(self):
         super().show()
@@ -175,6 +201,13 @@ class TaskWidget(QWidget):
         super().hide()
         self.scrollarea.hide()
 
+    def flush_edits(self, **kwargs):
+        """
+        Sets the name and description typed since the last pause to the task right away.
+        """
+        self.title_widget.flush_edit()
+        self.description_widget.flush_edit()
+
     def make_path_widget(self):
         class PathWidget(QWidget):
             """
@@ -209,11 +242,15 @@ class TaskWidget(QWidget):
                 self.supertask_pushbuttons = []
                 self.make_path()
                 self.layout.addStretch()
-                slots = [slot for slot in self.task.parent_changed._slots if
-                         'PathWidget.' in str(slot)]
-                for slot in slots:
-                    self.task.parent_changed.disconnect(slot)
-                self.task.parent_changed.connect(lambda **kwargs: self.make_path())
+                # Replace the path widget previously connected to this task, if any
+                previous_widget = _path_widgets.get(id(self.task))
+                if previous_widget is not None:
+                    self.task.parent_changed.disconnect(previous_widget.on_parent_changed)
+                self.task.parent_changed.connect(self.on_parent_changed)
+                _path_widgets[id(self.task)] = self
+
+            def on_parent_changed(self, **kwargs):
+                self.make_path()
 
             def make_icon_label(self):
                 self.icon_label = QLabel()
@@ -221,7 +258,7 @@ class TaskWidget(QWidget):
                 # Icon
                 icon_path = self.parent()._style.icon_path
                 icon_filename = os.path.join(icon_path, 'supertask.png')
-                pixmap = QIcon(icon_filename).pixmap(ICON_SIZES['regular'])
+                pixmap = get_icon(icon_filename).pixmap(ICON_SIZES['regular'])
                 self.icon_label.setPixmap(pixmap)
 
             def make_path(self):
@@ -248,7 +285,7 @@ class TaskWidget(QWidget):
                                              style=self.parent()._style)
                     task_widget.show()
 
-                def update_widget():
+                def update_widget(**kwargs):
                     n_max = min([len(supertask.name), 20])
                     text = supertask.name[:n_max]
                     if n_max == 20:
@@ -257,7 +294,7 @@ class TaskWidget(QWidget):
 
                 # Connect task and widget
                 pushbutton.clicked.connect(callback)
-                supertask.name_changed.connect(lambda **kwargs: update_widget())
+                supertask.name_changed.connect(update_widget)
                 # Set initial text
                 update_widget()
                 return pushbutton
@@ -294,6 +331,26 @@ class TaskWidget(QWidget):
                 self.make_textedit()
                 self.layout.addStretch()
 
+            def eventFilter(self, obj, event):
+                """
+                This function allows to handle all kinds of events for all subwidgets in this widget.
+                :param obj:
+                :param event:
+                :return:
+                """
+                if obj == self.textedit and event.type() == QEvent.FocusOut:
+                    self.flush_edit()
+
+                return super().eventFilter(obj, event)
+
+            def flush_edit(self):
+                """
+                Sets the name typed since the last pause to the task right away.
+                """
+                if self.callback_timer.isActive():
+                    self.callback_timer.stop()
+                    self.task.name = self.textedit.toPlainText().replace('\n', ' ')
+
             def make_textedit(self):
                 self.textedit = QTextEdit()
                 # Layout
@@ -304,7 +361,7 @@ class TaskWidget(QWidget):
                     # Update task
                     self.task.name = self.textedit.toPlainText().replace('\n', ' ')
 
-                def inv_callback():
+                def inv_callback(**kwargs):
                     # Update widget
                     """
                     This function is only called when the task's property is
@@ -312,6 +369,9 @@ class TaskWidget(QWidget):
                     at the time of updating the widget, an infinite recursion is triggered
                     between task update and widget update.
                     """
+                    # The name was typed in this widget: the text is already up to date
+                    if self.textedit.toPlainText().replace('\n', ' ') == self.task.name:
+                        return
                     cursor = self.textedit.textCursor()
                     # Update widget
                     """
@@ -337,12 +397,19 @@ class TaskWidget(QWidget):
                     cursor.clearSelection()
                     self.textedit.setTextCursor(cursor)
 
+                # Set the name to the task once typing pauses, rather than on every keystroke
+                self.callback_timer = QTimer(self)
+                self.callback_timer.setSingleShot(True)
+                self.callback_timer.setInterval(TEXT_EDIT_DEBOUNCE_INTERVAL)
+                self.callback_timer.timeout.connect(callback)
                 # Connect task and widget
-                self.textedit.textChanged.connect(lambda: callback())
-                self.task.name_changed.connect(lambda **kwargs: inv_callback())
+                self.textedit.textChanged.connect(self.callback_timer.start)
+                self.task.name_changed.connect(inv_callback)
                 # Set initial value
                 inv_callback()
                 self.textedit.setPlaceholderText("Task Name")
+                # Pending edits are set to the task when the textedit loses focus
+                self.textedit.installEventFilter(self)
 
         self.title_widget = TitleWidget(task=self.task,
                                         parent=self)
@@ -354,7 +421,7 @@ class TaskWidget(QWidget):
         # Icon
         icon_path = self._style.icon_path
         icon_filename = os.path.join(icon_path, 'download.png')
-        self.download_pushbutton.setIcon(QIcon(icon_filename))
+        self.download_pushbutton.setIcon(get_icon(icon_filename))
 
         # User interactions
         def callback():
@@ -366,7 +433,7 @@ class TaskWidget(QWidget):
             except Exception as e:
                 print(e)
 
-        self.download_pushbutton.clicked.connect(lambda: callback())
+        self.download_pushbutton.clicked.connect(callback)
 
     def make_color_widget(self):
         class ColorWidget(QWidget):
@@ -416,7 +483,7 @@ class TaskWidget(QWidget):
                     if not self.color_dialog.isVisible():
                         self.color_dialog.show()
 
-                def update_color(ask: bool = False):
+                def update_color(ask: bool = False, **kwargs):
                     if self.task.color is None:
                         self.task.color = self.parent()._style.color_palette['background 2']
                     stylesheet = '''
@@ -438,7 +505,7 @@ class TaskWidget(QWidget):
                 # Connect task and widget
                 self.color_pushbutton.clicked.connect(clicked)
                 # Keep connecting
-                self.task.color_changed.connect(lambda **kwargs: update_color())
+                self.task.color_changed.connect(update_color)
                 # Set initial value
                 update_color()
 
@@ -529,7 +596,7 @@ class TaskWidget(QWidget):
                     icon_filename = os.path.join(icon_path, f'progress_{level.replace(" ", "-")}.png')
                     self.combobox.addItem(level)
                     self.combobox.setItemIcon(i,
-                                              QIcon(icon_filename))
+                                              get_icon(icon_filename))
                 # User interactions
                 def clicked():
                     self.task.progress = self.combobox.currentText()
@@ -587,7 +654,7 @@ class TaskWidget(QWidget):
                     self.task.link_dates_to_subtasks = not self.task.link_dates_to_subtasks
                     update()
 
-                def update():
+                def update(**kwargs):
                     color_off = self.parent()._style.color_palette['background 1']
                     color_on = self.parent()._style.color_palette['text - highlight']
                     stylesheet = self.parent()._style.stylesheets['standard view']['link_dates_widget']['pushbutton']
@@ -604,7 +671,7 @@ class TaskWidget(QWidget):
                 # Connect task and widget
                 self.pushbutton.clicked.connect(clicked)
                 # Keep connecting
-                self.task.link_dates_to_subtasks_changed.connect(lambda **kwargs: update())
+                self.task.link_dates_to_subtasks_changed.connect(update)
                 # Set initial value
                 update()
 
@@ -679,14 +746,14 @@ class TaskWidget(QWidget):
                     lambda **kwargs: self.combobox.setCurrentText(self.task.category))
                 # Connect planner and widget
                 if self.planner is not None:
-                    def update_categories():
+                    def update_categories(**kwargs):
                         self.combobox.blockSignals(True)
                         for i in range(self.combobox.count()):
                             self.combobox.removeItem(0)
                         self.combobox.addItems(self.planner.categories)
                         self.combobox.setCurrentText(self.task.category)
                         self.combobox.blockSignals(False)
-                    self.planner.categories_changed.connect(lambda **kwargs: update_categories())
+                    self.planner.categories_changed.connect(update_categories)
                 # Set initial value
                 self.combobox.setCurrentText(self.task.category)
 
@@ -697,14 +764,14 @@ class TaskWidget(QWidget):
                 # Icon
                 icon_path = self.parent()._style.icon_path
                 icon_filename = os.path.join(icon_path, 'add.png')
-                self.add_pushbutton.setIcon(QIcon(icon_filename))
+                self.add_pushbutton.setIcon(get_icon(icon_filename))
                 # User interactions
                 def callback():
                     # Show the new textedit
                     self.new_textedit.setText('')
                     self.new_textedit.show()
 
-                self.add_pushbutton.clicked.connect(lambda: callback())
+                self.add_pushbutton.clicked.connect(callback)
 
             def make_new_textedit(self):
                 # textedit to define a new assignee when the 'plus' button is clicked
@@ -713,18 +780,20 @@ class TaskWidget(QWidget):
                 self.layout.addWidget(self.new_textedit)
 
                 def callback():
+                    # More than one block means a newline was typed, so no need to scan the text
+                    if self.new_textedit.document().blockCount() <= 1:
+                        return
                     text = self.new_textedit.toPlainText()
-                    if '\n' in text:
-                        text = text.replace('\n', '')
-                        all_items = [self.combobox.itemText(i) for i in range(self.combobox.count())]
-                        if text not in all_items:
-                            self.combobox.addItem(text)
-                            self.task.category = text if text != '' else None
-                            if self.planner is not None:
-                                self.planner.add_categories(self.task.category)
-                        self.new_textedit.hide()
-
-                self.new_textedit.textChanged.connect(lambda: callback())
+                    text = text.replace('\n', '')
+                    # Look the text up among the combobox items without copying them
+                    if self.combobox.findText(text) < 0:
+                        self.combobox.addItem(text)
+                        self.task.category = text if text != '' else None
+                        if self.planner is not None:
+                            self.planner.add_categories(self.task.category)
+                    self.new_textedit.hide()
+
+                self.new_textedit.textChanged.connect(callback)
                 self.new_textedit.setPlaceholderText("+ New Category")
                 self.new_textedit.hide()
 
@@ -797,14 +866,14 @@ class TaskWidget(QWidget):
                     lambda **kwargs: self.combobox.setCurrentText(self.task.assignee))
                 # Connect planner and widget
                 if self.planner is not None:
-                    def update_assignees():
+                    def update_assignees(**kwargs):
                         self.combobox.blockSignals(True)
                         for i in range(self.combobox.count()):
                             self.combobox.removeItem(0)
                         self.combobox.addItems(self.planner.assignees)
                         self.combobox.setCurrentText(self.task.assignee)
                         self.combobox.blockSignals(False)
-                    self.planner.assignees_changed.connect(lambda **kwargs: update_assignees())
+                    self.planner.assignees_changed.connect(update_assignees)
                 # Set initial value
                 self.combobox.setCurrentText(self.task.assignee)
 
@@ -815,14 +884,14 @@ class TaskWidget(QWidget):
                 # Icon
                 icon_path = self.parent()._style.icon_path
                 icon_filename = os.path.join(icon_path, 'add.png')
-                self.add_pushbutton.setIcon(QIcon(icon_filename))
+                self.add_pushbutton.setIcon(get_icon(icon_filename))
 
                 def callback():
                     # Show the new assignee linedit
                     self.new_textedit.setText('')
                     self.new_textedit.show()
 
-                self.add_pushbutton.clicked.connect(lambda: callback())
+                self.add_pushbutton.clicked.connect(callback)
 
             def make_new_textedit(self):
                 # textedit to define a new assignee when the 'plus' button is clicked
@@ -831,18 +900,20 @@ class TaskWidget(QWidget):
                 self.layout.addWidget(self.new_textedit)
 
                 def callback():
+                    # More than one block means a newline was typed, so no need to scan the text
+                    if self.new_textedit.document().blockCount() <= 1:
+                        return
                     text = self.new_textedit.toPlainText()
-                    if '\n' in text:
-                        text = text.replace('\n', '')
-                        all_items = [self.combobox.itemText(i) for i in range(self.combobox.count())]
-                        if text not in all_items:
-                            self.combobox.addItem(text)
-                            self.task.assignee = text if text != '' else None
-                            if self.planner is not None:
-                                self.planner.add_assignees(self.task.assignee)
-                        self.new_textedit.hide()
-
-                self.new_textedit.textChanged.connect(lambda: callback())
+                    text = text.replace('\n', '')
+                    # Look the text up among the combobox items without copying them
+                    if self.combobox.findText(text) < 0:
+                        self.combobox.addItem(text)
+                        self.task.assignee = text if text != '' else None
+                        if self.planner is not None:
+                            self.planner.add_assignees(self.task.assignee)
+                    self.new_textedit.hide()
+
+                self.new_textedit.textChanged.connect(callback)
                 self.new_textedit.setPlaceholderText("+ New Assignee")
                 self.new_textedit.hide()
 
@@ -894,7 +965,7 @@ class TaskWidget(QWidget):
                     icon_filename = os.path.join(icon_path, f'priority_{level.replace(" ", "-")}.png')
                     self.combobox.addItem(level)
                     self.combobox.setItemIcon(i,
-                                              QIcon(icon_filename))
+                                              get_icon(icon_filename))
                 # User interactions
                 def clicked():
                     self.task.priority = self.combobox.currentText()
@@ -979,9 +1050,13 @@ class TaskWidget(QWidget):
                 :return:
                 """
                 if obj == self.textbrowser:
-                    if (event.type() == QEvent.KeyPress
-                        and event.modifiers() == Qt.ControlModifier
-                        and event.key() == Qt.Key_Return):
+                    if event.type() == QEvent.FocusOut:
+                        self.flush_edit()
+                    elif (event.type() == QEvent.KeyPress
+                          and event.modifiers() == Qt.ControlModifier
+                          and event.key() == Qt.Key_Return):
+                        # Set the text typed since the last pause to the task, before it is rendered
+                        self.flush_edit()
                         if self.is_rendering:
                             self.textbrowser.setReadOnly(False)
                             self.render_description(render_type='Plain Text')
@@ -992,6 +1067,14 @@ class TaskWidget(QWidget):
 
                 return super().eventFilter(obj, event)
 
+            def flush_edit(self):
+                """
+                Sets the description typed since the last pause to the task right away.
+                """
+                if self.callback_timer.isActive():
+                    self.callback_timer.stop()
+                    self.task.description = self.textbrowser.toPlainText()
+
             def render_description(self,
                                    render_type: str = None):
                 if render_type is None:
@@ -1029,7 +1112,6 @@ class TaskWidget(QWidget):
                 self.label.setText('Editing (press CTRL+Enter to render)')
 
             def make_textbrowser(self):
-                import sys
                 self.textbrowser = QTextBrowser()
                 self.textbrowser.setOpenLinks(True)
                 self.textbrowser.setOpenExternalLinks(True)
@@ -1042,7 +1124,10 @@ class TaskWidget(QWidget):
                     # Update task
                     self.task.description = self.textbrowser.toPlainText()
 
-                def inv_callback():
+                def inv_callback(**kwargs):
+                    # The description was typed in this widget: the text is already up to date
+                    if self.textbrowser.toPlainText() == self.task.description:
+                        return
                     cursor = self.textbrowser.textCursor()
                     # Update widget
                     """
@@ -1069,9 +1154,14 @@ class TaskWidget(QWidget):
                     # Reset cursor
                     self.textbrowser.setTextCursor(cursor)
 
+                # Set the description to the task once typing pauses, rather than on every keystroke
+                self.callback_timer = QTimer(self)
+                self.callback_timer.setSingleShot(True)
+                self.callback_timer.setInterval(TEXT_EDIT_DEBOUNCE_INTERVAL)
+                self.callback_timer.timeout.connect(callback)
                 # Connect task and widget
-                self.textbrowser.textChanged.connect(lambda: callback())
-                self.task.description_changed.connect(lambda **kwargs: inv_callback())
+                self.textbrowser.textChanged.connect(self.callback_timer.start)
+                self.task.description_changed.connect(inv_callback)
                 # Set initial value
                 inv_callback()
                 self.textbrowser.setPlaceholderText("Task description")
@@ -1139,7 +1229,7 @@ class TaskWidget(QWidget):
                 # Icon
                 icon_path = self.parent()._style.icon_path
                 icon_filename = os.path.join(icon_path, 'subtask.png')
-                pixmap = QIcon(icon_filename).pixmap(ICON_SIZES['regular'])
+                pixmap = get_icon(icon_filename).pixmap(ICON_SIZES['regular'])
                 self.icon_label.setPixmap(pixmap)
 
             def make_new_textedit(self):
@@ -1149,29 +1239,32 @@ class TaskWidget(QWidget):
                 # Geometry
 
                 def callback():
-                    if '\n' in self.new_textedit.toPlainText():
-                        new_task = Task(name=self.new_textedit.toPlainText()[:-1])
-                        self.new_textedit.blockSignals(True)
+                    # More than one block means a newline was typed, so no need to scan the text
+                    if self.new_textedit.document().blockCount() <= 1:
+                        return
+                    text = self.new_textedit.toPlainText()
+                    new_task = Task(name=text[:-1])
+                    # Signals are unblocked even if setText raises
+                    with QSignalBlocker(self.new_textedit):
                         self.new_textedit.setText('')
-                        self.new_textedit.blockSignals(False)
-                        """
-                        For some reason, the cursor is normally reset to the start of the 
-                        widget. One then needs to move the cursor to the end and then reset the cursor
-                        """
-                        # Move cursor to the end
-                        cursor = self.new_textedit.textCursor()
-                        cursor.movePosition(cursor.Left,
-                                            cursor.MoveAnchor,
-                                            0)
-                        """
-                        For some other reason, all text is also automatically selected, so one needs to
-                        clear the selection.
-                        """
-                        cursor.clearSelection()
-                        # Add new subtask
-                        self.task.add_children_tasks(new_task)
-
-                self.new_textedit.textChanged.connect(lambda: callback())
+                    """
+                    For some reason, the cursor is normally reset to the start of the 
+                    widget. One then needs to move the cursor to the end and then reset the cursor
+                    """
+                    # Move cursor to the end
+                    cursor = self.new_textedit.textCursor()
+                    cursor.movePosition(cursor.Left,
+                                        cursor.MoveAnchor,
+                                        0)
+                    """
+                    For some other reason, all text is also automatically selected, so one needs to
+                    clear the selection.
+                    """
+                    cursor.clearSelection()
+                    # Add new subtask
+                    self.task.add_children_tasks(new_task)
+
+                self.new_textedit.textChanged.connect(callback)
                 self.new_textedit.setPlaceholderText("+ New Subtask")
 
             def make_upload_pushbutton(self):
@@ -1180,7 +1273,7 @@ class TaskWidget(QWidget):
                 # Icon
                 icon_path = self._style.icon_path
                 icon_filename = os.path.join(icon_path, 'upload.png')
-                self.upload_pushbutton.setIcon(QIcon(icon_filename))
+                self.upload_pushbutton.setIcon(get_icon(icon_filename))
 
                 # User interactions
                 def callback():
@@ -1191,24 +1284,26 @@ class TaskWidget(QWidget):
                     except Exception as e:
                         print(e)
 
-                self.upload_pushbutton.clicked.connect(lambda: callback())
+                self.upload_pushbutton.clicked.connect(callback)
 
             def make_subtask_widgets(self, **kwargs):
-                for subtask in self.task.children:
-                    if subtask not in [widget.task for widget in self.subtask_widgets]:
-                        widget = TaskWidgetSimple(parent=self,
-                                                  task=subtask,
-                                                  planner=self.planner,
-                                                  style=self._style,
-                                                  widget_spacing=15
-                                                  )
-                        self.layout.addWidget(widget)
-                        self.subtask_widgets += [widget]
+                missing, stale = diff_task_widgets(self.task.children, self.subtask_widgets)
+                for subtask in missing:
+                    widget = TaskWidgetSimple(parent=self,
+                                              task=subtask,
+                                              planner=self.planner,
+                                              style=self._style,
+                                              widget_spacing=15
+                                              )
+                    self.layout.addWidget(widget)
+                    self.subtask_widgets.append(widget)
                 # Remove non-existent sub-tasks
-                for widget in self.subtask_widgets:
-                    if widget.task not in self.task.children:
-                        widget.hide()
-                        self.subtask_widgets.remove(widget)
+                for widget in stale:
+                    self.subtask_widgets.remove(widget)
+                    self.layout.removeWidget(widget)
+                    widget.disconnect_task()
+                    widget.setParent(None)
+                    widget.deleteLater()
 
         self.subtask_list_widget = SubtaskListWidget(task=self.task,
                                                      planner=self.planner,
@@ -1286,6 +1381,15 @@ class TaskWidgetSimple(QWidget):
             for widget in self.subtask_widgets:
                 widget.set_style(self._style)
 
+    def disconnect_task(self):
+        """
+        Disconnects this widget and all its subtask widgets from the signals of their tasks.
+        """
+        self.task.children_changed.disconnect(self.update_widget)
+        self.task_line_widget.disconnect_task()
+        for widget in self.subtask_widgets:
+            widget.disconnect_task()
+
     def update_widget(self, **kwargs):
         self.make_subtasks()
         if not self.task.is_bottom_level:
@@ -1293,24 +1397,25 @@ class TaskWidgetSimple(QWidget):
         else:
             self.task_line_widget.expand_pushbutton.hide()
     def make_subtasks(self, **kwargs):
+        missing, stale = diff_task_widgets(self.task.children, self.subtask_widgets)
         # Add new subtasks
-        for subtask in self.task.children:
-            if subtask not in [widget.task for widget in self.subtask_widgets]:
-                subtask_widget = TaskWidgetSimple(parent=self,
-                                                  task=subtask,
-                                                  planner=self.planner,
-                                                  hide=not self.task_line_widget.expanded,
-                                                  style=self._style,
-                                                  widget_spacing=self.layout.spacing()
-                                                  )
-                self.layout.addWidget(subtask_widget)
-                self.subtask_widgets += [subtask_widget]
+        for subtask in missing:
+            subtask_widget = TaskWidgetSimple(parent=self,
+                                              task=subtask,
+                                              planner=self.planner,
+                                              hide=not self.task_line_widget.expanded,
+                                              style=self._style,
+                                              widget_spacing=self.layout.spacing()
+                                              )
+            self.layout.addWidget(subtask_widget)
+            self.subtask_widgets.append(subtask_widget)
         # Remove non-existent sub-tasks
-        for widget in self.subtask_widgets:
-            if widget.task not in self.task.children:
-                widget.hide()
-                self.subtask_widgets.remove(widget)
-                self.layout.removeWidget(widget)
+        for widget in stale:
+            self.subtask_widgets.remove(widget)
+            self.layout.removeWidget(widget)
+            widget.disconnect_task()
+            widget.setParent(None)
+            widget.deleteLater()
 
 
     def show(self):
@@ -1349,6 +1454,8 @@ class TaskLineWidget(QFrame):
         """
         self.task, self.planner = task, planner
         self._style = style
+        # (signal, slot) pairs connected to the task
+        self.task_slots = []
         super().__init__(parent=parent)
         # Layout
         self.layout = QHBoxLayout(self)
@@ -1375,9 +1482,20 @@ class TaskLineWidget(QFrame):
         self.make_expand_pushbutton()
         self.layout.addStretch()
         # Set style
-        self.task.color_changed.connect(lambda **kwargs: self.set_style())
+        self.connect_task(self.task.color_changed, lambda **kwargs: self.set_style())
         self.set_style()
 
+    def connect_task(self, signal: Signal, slot):
+        signal.connect(slot)
+        self.task_slots += [(signal, slot)]
+
+    def disconnect_task(self):
+        for signal, slot in self.task_slots:
+            signal.disconnect(slot)
+        self.task_slots = []
+        self.start_date_widget.disconnect_task()
+        self.end_date_widget.disconnect_task()
+
     def set_style(self, style: TaskWidgetStyle = None):
         self._style = style if style is not None else self._style
         if self._style is not None:
@@ -1406,12 +1524,12 @@ class TaskLineWidget(QFrame):
                                      style=self._style)
             task_widget.show()
 
-        def update_widget():
+        def update_widget(**kwargs):
             self.name_pushbutton.setText(self.task.name)
 
         # Connect task and widget
         self.name_pushbutton.clicked.connect(clicked)
-        self.task.name_changed.connect(lambda **kwargs: update_widget())
+        self.connect_task(self.task.name_changed, update_widget)
         # Set initial text
         update_widget()
 
@@ -1421,15 +1539,15 @@ class TaskLineWidget(QFrame):
         self.layout.addWidget(self.priority_label)
         # Geometry
 
-        def update_widget():
+        def update_widget(**kwargs):
             # Set icon
             icon_path = self.parent()._style.icon_path
             icon_filename = os.path.join(icon_path, f'priority_{self.task.priority}.png')
-            pixmap = QIcon(icon_filename).pixmap(ICON_SIZES['small'])
+            pixmap = get_icon(icon_filename).pixmap(ICON_SIZES['small'])
             self.priority_label.setPixmap(pixmap)
 
         # Connect task and widget
-        self.task.priority_changed.connect(lambda **kwargs: update_widget())
+        self.connect_task(self.task.priority_changed, update_widget)
         # Set initial text
         update_widget()
 
@@ -1439,15 +1557,15 @@ class TaskLineWidget(QFrame):
         self.layout.addWidget(self.progress_label)
         # Geometry
 
-        def update_widget():
+        def update_widget(**kwargs):
             # Set icon
             icon_path = self.parent()._style.icon_path
             icon_filename = os.path.join(icon_path, f'progress_{self.task.progress.replace(" ", "-")}.png')
-            pixmap = QIcon(icon_filename).pixmap(ICON_SIZES['small'])
+            pixmap = get_icon(icon_filename).pixmap(ICON_SIZES['small'])
             self.progress_label.setPixmap(pixmap)
 
         # Connect task and widget
-        self.task.progress_changed.connect(lambda **kwargs: update_widget())
+        self.connect_task(self.task.progress_changed, update_widget)
         # Set initial text
         update_widget()
 
@@ -1471,7 +1589,7 @@ class TaskLineWidget(QFrame):
         icon_path = self.parent()._style.icon_path
         icon_filename = os.path.join(icon_path,
                                      'subtask-widget_not-expanded.png')
-        self.expand_pushbutton.setIcon(QIcon(icon_filename))
+        self.expand_pushbutton.setIcon(get_icon(icon_filename))
 
         # Callback
         def callback():
@@ -1492,7 +1610,7 @@ class TaskLineWidget(QFrame):
             name = 'expanded' if self.expanded else 'not-expanded'
             icon_filename = os.path.join(icon_path,
                                          f'subtask-widget_{name}.png')
-            self.expand_pushbutton.setIcon(QIcon(icon_filename))
+            self.expand_pushbutton.setIcon(get_icon(icon_filename))
 
         self.expand_pushbutton.clicked.connect(callback)
         if self.task.is_bottom_level:
@@ -1512,7 +1630,7 @@ class TaskLineWidget(QFrame):
         icon_path = self.parent()._style.icon_path
         icon_filename = os.path.join(icon_path,
                                      'remove.png')
-        self.remove_pushbutton.setIcon(QIcon(icon_filename))
+        self.remove_pushbutton.setIcon(get_icon(icon_filename))
 
         # Callback
         def callback():
@@ -1552,6 +1670,8 @@ class DateWidget(QWidget):
             raise ValueError(f'Unrecognized time more {time_mode}. Possible time modes are {tuple(TIME_MODES)}')
         self.task = task
         self.time_mode = time_mode
+        # (signal, slot) pairs connected to the task
+        self.task_slots = []
         super().__init__(parent=parent)
         # Layout
         self.layout = QVBoxLayout()
@@ -1565,6 +1685,15 @@ class DateWidget(QWidget):
         # Calendar widget
         self.make_calendar_widget()
 
+    def connect_task(self, signal: Signal, slot):
+        signal.connect(slot)
+        self.task_slots += [(signal, slot)]
+
+    def disconnect_task(self):
+        for signal, slot in self.task_slots:
+            signal.disconnect(slot)
+        self.task_slots = []
+
     def make_label(self):
         self.label = QLabel(f'{self.time_mode.title()} Date')
         self.layout.addWidget(self.label)
@@ -1576,11 +1705,11 @@ class DateWidget(QWidget):
         self.layout.addWidget(self.pushbutton)
 
         # User interactions
-        def update_label():
+        def update_label(**kwargs):
             date = getattr(self.task, f'{self.time_mode}_date')
             self.pushbutton.setText(f'{date.day}/{date.month}/{date.year}')
 
-        getattr(self.task, f'{self.time_mode}_date_changed').connect(lambda **kwargs: update_label())
+        self.connect_task(getattr(self.task, f'{self.time_mode}_date_changed'), update_label)
         update_label()
 
         def clicked():
@@ -6,6 +6,20 @@ from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
 
 
+def set_style_sheet(widget, stylesheet: str):
+    """
+    Sets a style sheet to a widget, unless it is already set. Setting a style sheet makes Qt parse it
+    and polish the widget and all its children again, even if the style sheet has not changed.
+    :param widget: :py:class:'QWidget'
+        The widget to which the style sheet is set.
+    :param stylesheet: str
+        The style sheet
+    :return:
+    """
+    if widget.styleSheet() != stylesheet:
+        widget.setStyleSheet(stylesheet)
+
+
 def set_style(widget, stylesheets):
     """
     Recursively set style sheets to a widget and all its sub-widgets.
@@ -17,12 +31,12 @@ def set_style(widget, stylesheets):
     :return:
     """
     if type(stylesheets) is str: # widget is an 'elementary' QWidget
-        widget.setStyleSheet(stylesheets)
+        set_style_sheet(widget, stylesheets)
     else: # widget is a custom QWidget
         for widget_name in tuple(stylesheets):
             try:
                 if widget_name == 'main':
-                    widget.setStyleSheet(stylesheets['main'])
+                    set_style_sheet(widget, stylesheets['main'])
                 else:
                     set_style(widget=getattr(widget, widget_name),
                               stylesheets=stylesheets[widget_name])
@@ -30,13 +44,22 @@ def set_style(widget, stylesheets):
                 print(e)
 
 from screeninfo import get_monitors
+from functools import lru_cache
 
+@lru_cache(maxsize=1)
 def get_primary_screen():
+    # Cached, as the display server is otherwise queried by every style and widget module
     monitors = get_monitors()
     return [m for m in monitors if m.is_primary][0]
 
 
 from PyQt5.Qt import QCursor, QApplication
+from PyQt5.QtGui import QIcon
+
+@lru_cache(maxsize=None)
+def get_icon(filename):
+    # Cached, so that each icon file is read and decoded once, instead of once per widget showing it
+    return QIcon(filename)
 
 def get_pixel_ratio():
     # Source: https://stackoverflow.com/a/40053864/3388962
@@ -1,7 +1,7 @@
 """
 This module defines a task planner.
 """
-from taskplanner.tasks import Task, _signal_changed_property
+from taskplanner.tasks import Task, _signal_changed_property, _unsignal_changed_property
 from signalslot import Signal
 from PyQt5.Qt import QCalendar
 from logging import warning
@@ -49,13 +49,19 @@ class Planner:
     def all_tasks(self):
         all_tasks = []
         for task in self.tasks:
-            all_tasks += [task] + list(task.descendants)
+            all_tasks.append(task)
+            all_tasks.extend(task.descendants)
         return all_tasks
 
     def add_tasks(self,
                   *tasks: Task):
+        # Signal the change once, however many tasks are added, along with the added tasks
+        added = []
+        # Tasks are compared by identity, so look them up by id rather than scanning the list for each task
+        task_ids = {id(task) for task in self._tasks}
         for task in tasks:
-            if task not in self.tasks:
+            if id(task) not in task_ids:
+                task_ids.add(id(task))
                 self._tasks += [task]
                 _signal_changed_property(task=task,
                                          signal=self.tasks_changed,
@@ -66,19 +72,33 @@ class Planner:
                 self._add_new_values(task=task,
                                      signal=self.categories_changed,
                                      property_name='assignee')
-                self.tasks_changed.emit()
+                added += [task]
+        if added:
+            self.tasks_changed.emit(added=added,
+                                    removed=[])
 
     def remove_tasks(self,
                      *tasks: Task):
+        # Signal the change once, however many tasks are removed, along with the removed tasks
+        removed = []
+        task_ids = {id(task) for task in self._tasks}
         for task in tasks:
-            if task in self.tasks:
-                self._tasks.remove(task)
+            if id(task) in task_ids:
+                task_ids.remove(id(task))
                 '''
                 _signal_changed_property(task=task,
                                          signal=self.tasks_changed,
                                          property_name='children')
                 '''
-                self.tasks_changed.emit()
+                _unsignal_changed_property(task=task,
+                                           signal=self.tasks_changed,
+                                           property_name='children')
+                removed += [task]
+        if removed:
+            # Remove all tasks from the list in a single pass
+            self._tasks = [task for task in self._tasks if id(task) in task_ids]
+            self.tasks_changed.emit(added=[],
+                                    removed=removed)
 
     def add_categories(self,
                        *categories: str):
@@ -117,12 +137,10 @@ class Planner:
             raise ValueError(f'Invalid property "{property_name}". Valid properties are (category, assignee)')
         plural_form = f'{property_name[:-1]}ies' if property_name[-1]=='y' else f'{property_name}s'
         getattr(self, f'add_{plural_form}')(getattr(task, property_name))
-        getattr(task, f'{property_name}_changed').connect(
-            lambda **kwargs: signal.emit())
+        getattr(task, f'{property_name}_changed').connect(signal.emit)
         for subtask in task.descendants:
             getattr(self, f'add_{plural_form}')(getattr(subtask, property_name))
-            getattr(subtask, f'{property_name}_changed').connect(
-                lambda **kwargs: signal.emit())
+            getattr(subtask, f'{property_name}_changed').connect(signal.emit)
         '''
         if task.is_bottom_level and getattr(task, property_name) not in getattr(self, plural_form):
             getattr(self, plural_form).append(getattr(task, property_name))
@@ -149,8 +167,8 @@ class Planner:
         planner = Planner()
         s = ''.join(string.split('___PLANNER___')[1:])
         task_strings = s.split('\n___TOP LEVEL TASK___')[1:]
-        for task_string in task_strings:
-            planner.add_tasks(Task.from_string(task_string))
+        # Add all tasks at once, so that the planner signals a single change
+        planner.add_tasks(*[Task.from_string(task_string) for task_string in task_strings])
         return planner
 
     def to_file(self,
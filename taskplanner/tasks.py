@@ -3,6 +3,7 @@ This module describes a task and the relation between parent and children tasks.
 '''
 
 from datetime import date
+from functools import lru_cache
 from inspect import currentframe, getargvalues
 from logging import warning
 import os
@@ -604,10 +605,20 @@ class Task(Node):
 
 
 
+@lru_cache(maxsize=None)
+def _changed_property_names():
+    """
+    :return: tuple of str
+        The names of the task properties that have a '<property>_changed' signal.
+        An example task has to be built for this, so the result is cached.
+    """
+    return tuple(attr.replace('_changed', '') for attr in vars(Task()) if '_changed' in attr)
+
+
 def _signal_changed_property(task: Task,
                              signal: Signal,
                              property_name: str):
-    valid_properties = [attr.replace('_changed', '') for attr in vars(Task()) if '_changed' in attr]
+    valid_properties = _changed_property_names()
     if property_name not in valid_properties:
         raise ValueError(f'Invalid property "{property_name}". Valid properties are {tuple(valid_properties)}')
     '''
@@ -619,8 +630,21 @@ def _signal_changed_property(task: Task,
                                      signal=signal,
                                      property_name=property_name)
     '''
-    getattr(task, f'{property_name}_changed').connect(lambda **kwargs: signal.emit())
+    # The signal's bound emit method is connected, rather than a new closure,
+    # so that connecting twice is a no-op and the connection can be undone
+    getattr(task, f'{property_name}_changed').connect(signal.emit)
+    for subtask in task.descendants:
+        getattr(subtask, f'{property_name}_changed').connect(signal.emit)
+
+
+def _unsignal_changed_property(task: Task,
+                               signal: Signal,
+                               property_name: str):
+    """
+    Undoes :py:func:'_signal_changed_property'.
+    """
+    getattr(task, f'{property_name}_changed').disconnect(signal.emit)
     for subtask in task.descendants:
-        getattr(subtask, f'{property_name}_changed').connect(lambda **kwargs: signal.emit())
+        getattr(subtask, f'{property_name}_changed').disconnect(signal.emit)
 
 